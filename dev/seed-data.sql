@@ -263,13 +263,13 @@ VALUES
      (select id from auth.auth_provider where name = 'github'),
      6245448,
      (select id from auth.user where username = 'huntcsg'),
-     '720dba52a94493d495a3a8fcd668388a44a98e2bba5685ef6f339933fdd72e53'
+     decode('720dba52a94493d495a3a8fcd668388a44a98e2bba5685ef6f339933fdd72e53', 'hex')
     ),
     (
      (select id from auth.auth_provider where name = 'github'),
      147355120,
      (select id from auth.user where username = 'Isaac'),
-     'f89ba90d514fbeefd5d2115b3f49fd7520480d9f94937a1e4794598aa124450a'
+     decode('f89ba90d514fbeefd5d2115b3f49fd7520480d9f94937a1e4794598aa124450a', 'hex')
     );
 
 INSERT INTO auth.user_role (created_by, user_id, role_id)
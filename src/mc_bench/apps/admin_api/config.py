@@ -9,6 +9,10 @@ class Settings:
     HUMANIZE_LOGS = os.environ.get("HUMANIZE_LOGS", "false") == "true"
     LOG_LEVEL_STR = os.environ.get("LOG_LEVEL", "INFO")
     LOG_LEVEL = getattr(logging, LOG_LEVEL_STR.upper(), logging.INFO)
+    BATCH_STATE_CHANGES = os.environ.get("BATCH_STATE_CHANGES", "false") == "true"
+    STATE_CHANGE_FLUSH_INTERVAL_MS = int(
+        os.environ.get("STATE_CHANGE_FLUSH_INTERVAL_MS", "50")
+    )
 
 
 settings = Settings()
@@ -6,20 +6,40 @@ from mc_bench.events.types import (
     RunStageStateChanged,
     RunStateChanged,
 )
-from mc_bench.models.run import Generation, Run, RunStage
+from mc_bench.models.run import (
+    Generation,
+    Run,
+    RunStage,
+    make_state_change_batcher,
+)
 from mc_bench.util.postgres import get_session
 
+from .config import settings
+
 
 @asynccontextmanager
 async def lifespan(app):
     session = get_session()
     engine = session.bind
 
-    on_event(RunStageStateChanged, RunStage.state_change_handler)
-    on_event(RunStateChanged, Run.state_change_handler)
-    on_event(GenerationStateChanged, Generation.state_change_handler)
+    batcher = None
+    if settings.BATCH_STATE_CHANGES:
+        batcher = make_state_change_batcher(
+            flush_interval=settings.STATE_CHANGE_FLUSH_INTERVAL_MS / 1000
+        )
+        on_event(RunStageStateChanged, batcher.handle)
+        on_event(RunStateChanged, batcher.handle)
+        on_event(GenerationStateChanged, batcher.handle)
+        batcher.start()
+    else:
+        on_event(RunStageStateChanged, RunStage.state_change_handler)
+        on_event(RunStateChanged, Run.state_change_handler)
+        on_event(GenerationStateChanged, Generation.state_change_handler)
 
     yield
 
+    if batcher is not None:
+        batcher.stop()
+
     # Close all connections and dispose of the engine
     engine.dispose()
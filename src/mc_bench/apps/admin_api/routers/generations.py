@@ -141,9 +141,16 @@ def get_generations(
     generations = db.scalars(
         select(Generation).order_by(Generation.created.desc())
     ).all()
+    run_counts = Generation.bulk_run_counts(
+        db, [generation.id for generation in generations]
+    )
     payload = {
         "data": [
-            generation.to_dict(include_runs=False, include_stats=True)
+            generation.to_dict(
+                include_runs=False,
+                include_stats=True,
+                run_count=run_counts.get(generation.id, 0),
+            )
             for generation in generations
         ],
         "total": len(generations),
@@ -1,4 +1,3 @@
-import json
 from typing import List, Optional, Union
 
 from fastapi import Depends, HTTPException, Query, status
@@ -250,7 +249,7 @@ def register_model(
                 name=provider.name,
                 created_by=user.id,
                 provider_class=provider.provider_class,
-                config=json.dumps(provider.config),
+                config=provider.config,
                 is_default=provider.is_default,
             )
             for provider in model_request.providers
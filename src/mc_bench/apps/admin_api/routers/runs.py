@@ -248,7 +248,11 @@ def get_run(
         )
 
     return run.to_dict(
-        include_samples=True, include_artifacts=True, include_stages=True, redis=redis
+        include_samples=True,
+        include_artifacts=True,
+        include_stages=True,
+        db=db,
+        redis=redis,
     )
 
 
@@ -8,12 +8,12 @@ from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session, selectinload
 
 from mc_bench.auth.permissions import PERM
-from mc_bench.constants import EXPERIMENTAL_STATE
+from mc_bench.constants import EXPERIMENTAL_STATE, SAMPLE_APPROVAL_STATE
 from mc_bench.models.experimental_state import experimental_state_id_for
 from mc_bench.models.log import SampleApproval, SampleObservation, SampleRejection
 from mc_bench.models.model import Model
 from mc_bench.models.prompt import Prompt, Tag
-from mc_bench.models.run import Run, Sample, SampleApprovalState, TestSet
+from mc_bench.models.run import Run, Sample, TestSet, sample_approval_state_id_for
 from mc_bench.models.template import Template
 from mc_bench.models.user import User
 from mc_bench.server.auth import AuthManager
@@ -88,7 +88,7 @@ def list_samples(
     if approval_state:
         logger.info("approval_state", approval_state=approval_state)
         valid_approval_filters = [
-            state.value
+            sample_approval_state_id_for(db, SAMPLE_APPROVAL_STATE(state.value))
             for state in approval_state
             if state
             in [
@@ -107,8 +107,8 @@ def list_samples(
             valid_approval_filters
             and SampleApprovalStateEnum.PENDING_APPROVAL not in approval_state
         ):
-            approval_filter = SampleApprovalState.name.in_(valid_approval_filters)
-            query = query.outerjoin(Sample.approval_state).filter(approval_filter)
+            approval_filter = Sample.approval_state_id.in_(valid_approval_filters)
+            query = query.filter(approval_filter)
         elif (
             SampleApprovalStateEnum.PENDING_APPROVAL in approval_state
             and len(approval_state) == 1
@@ -117,10 +117,10 @@ def list_samples(
             query = query.filter(approval_filter)
         else:
             approval_filter = or_(
-                SampleApprovalState.name.in_(valid_approval_filters),
+                Sample.approval_state_id.in_(valid_approval_filters),
                 pending_approval_filter,
             )
-            query = query.outerjoin(Sample.approval_state).filter(approval_filter)
+            query = query.filter(approval_filter)
 
     if experimental_state:
         query = query.filter(
@@ -250,12 +250,10 @@ def approve_sample(
 
     user = db.scalar(select(User).where(User.external_id == user_uuid))
 
-    approved_state = db.scalar(
-        select(SampleApprovalState).where(SampleApprovalState.name == "APPROVED")
-    )
-
     # Set approval state and test set
-    sample.approval_state = approved_state
+    sample.approval_state_id = sample_approval_state_id_for(
+        db, SAMPLE_APPROVAL_STATE.APPROVED
+    )
     sample.test_set_id = test_set.id
 
     sample_approval = SampleApproval(
@@ -292,10 +290,9 @@ def reject_sample(
         )
 
     user = db.scalar(select(User).where(User.external_id == user_uuid))
-    rejected_state = db.scalar(
-        select(SampleApprovalState).where(SampleApprovalState.name == "REJECTED")
+    sample.approval_state_id = sample_approval_state_id_for(
+        db, SAMPLE_APPROVAL_STATE.REJECTED
     )
-    sample.approval_state = rejected_state
     sample_rejection = SampleRejection(
         sample=sample,
         user=user,
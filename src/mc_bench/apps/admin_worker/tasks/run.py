@@ -12,7 +12,9 @@ from mc_bench.models.run import (
     PromptExecution,
     ResponseParsing,
     Sample,
+    bucket_for,
 )
+from mc_bench.schema.object_store.runs import path_for
 from mc_bench.util.logging import get_logger
 from mc_bench.util.object_store import get_client
 from mc_bench.util.text import parse_known_parts
@@ -226,17 +228,16 @@ def prepare_sample(stage_context: StageContext):
                 filepath=os.path.join(tmp_dir, "artifact.glb"),
             )
 
-            object_key = (
-                render_artifact_spec[key]["object_prototype"]
-                .materialize(**render_artifact_spec[key]["object_parts"])
-                .get_path()
+            object_key = path_for(
+                render_artifact_spec[key]["object_kind"],
+                **render_artifact_spec[key]["object_parts"],
             )
 
             sample_artifact = Artifact(
                 kind=render_artifact_spec[key]["artifact_kind"],
                 run_id=stage_context.run.id,
                 sample_id=stage_context.sample.id,
-                bucket=settings.EXTERNAL_OBJECT_BUCKET,
+                bucket=bucket_for(stage_context.db, settings.EXTERNAL_OBJECT_BUCKET),
                 key=object_key,
             )
 
@@ -8,7 +8,7 @@ from mc_bench.util.postgres import get_session
 from mc_bench.util.redis import RedisDatabase, get_redis_pool
 
 from .config import settings
-from .prepared_statements import COMPARISON_BATCH_QUERY
+from .prepared_statements import COMPARISON_BATCH_QUERY, INSERT_COMPARISON_QUERY
 
 github_oauth_client = GithubOauthClient(
     client_id=settings.GITHUB_CLIENT_ID,
@@ -42,6 +42,11 @@ async def lifespan(app):
             cursor.execute(
                 f"PREPARE comparison_batch_query(integer, integer) AS {COMPARISON_BATCH_QUERY}"
             )
+            cursor.execute(
+                "PREPARE insert_comparison"
+                "(integer, integer, integer, uuid, integer, integer[], integer[]) "
+                f"AS {INSERT_COMPARISON_QUERY}"
+            )
             dbapi_connection.commit()
         finally:
             cursor.close()
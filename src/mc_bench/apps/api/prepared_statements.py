@@ -151,3 +151,27 @@ COMPARISON_BATCH_QUERY = textwrap.dedent("""\
         ) sample_2_data
             ON samples.sample_2_id = sample_2_data.sample_id
 """)
+
+
+# Records a vote: the comparison and a rank row for each ranked sample, in one statement
+INSERT_COMPARISON_QUERY = textwrap.dedent("""\
+    WITH new_comparison AS (
+        INSERT INTO scoring.comparison (
+            user_id,
+            metric_id,
+            test_set_id,
+            session_id,
+            identification_token_id
+        )
+        VALUES ($1, $2, $3, $4, $5)
+        RETURNING id
+    )
+    INSERT INTO scoring.comparison_rank (comparison_id, sample_id, rank)
+    SELECT
+        new_comparison.id,
+        ranked.sample_id,
+        ranked.rank
+    FROM
+        new_comparison
+        CROSS JOIN unnest($6::integer[], $7::integer[]) AS ranked(sample_id, rank)
+""")
@@ -11,8 +11,6 @@ import mc_bench.schema.postgres as schema
 from mc_bench.apps.api.config import settings
 from mc_bench.auth.permissions import PERM
 from mc_bench.models.comparison import (
-    Comparison,
-    ComparisonRank,
     Metric,
     ModelLeaderboard,
     PromptLeaderboard,
@@ -23,7 +21,6 @@ from mc_bench.models.prompt import Prompt, Tag
 from mc_bench.models.run import Artifact, Run, Sample, TestSet
 from mc_bench.models.user import User
 from mc_bench.server.auth import AuthManager
-from mc_bench.models.experimental_state import ExperimentalState
 from mc_bench.util.cache import timed_cache
 from mc_bench.util.logging import get_logger
 from mc_bench.util.postgres import get_managed_session
@@ -248,26 +245,21 @@ def post_comparison(
 
     # Create a comparison record if user is anonymous or has voting permissions
     if can_vote:
-        # Create a comparison record
-        comparison = Comparison(
-            user_id=user.id if user else None,  # None for anonymous users
-            metric_id=metric.id,
-            test_set_id=test_set_id,
-            session_id=session_id,
-            identification_token_id=identification_token_id,
-        )
-        db.add(comparison)
-        db.flush()
-
-        # Add rank records for each sample
-        for rank, sample in ranks:
-            db.add(
-                ComparisonRank(
-                    comparison_id=comparison.id,
-                    sample_id=sample.id,
-                    rank=rank,
-                )
+        # Create a comparison record along with a rank record for each sample
+        db.execute(
+            sqlalchemy.text(
+                "EXECUTE insert_comparison(:user_id, :metric_id, :test_set_id, "
+                ":session_id, :identification_token_id, :sample_ids, :ranks)"
+            ).bindparams(
+                user_id=user.id if user else None,  # None for anonymous users
+                metric_id=metric.id,
+                test_set_id=test_set_id,
+                session_id=session_id,
+                identification_token_id=identification_token_id,
+                sample_ids=[sample.id for _, sample in ranks],
+                ranks=[rank for rank, _ in ranks],
             )
+        )
 
         # Trigger ELO calculation if needed
         if redis.set("elo_calculation_in_progress", "1", ex=300, nx=True):
@@ -445,40 +437,41 @@ def get_leaderboard(
                 detail=f"Tag with name '{tagName}' not found",
             )
 
-    # Query for leaderboard entries
+    # Query for leaderboard entries. The view already joins in the model and tag
+    # display columns and leaves out deprecated models. It is refreshed at the end of
+    # each ELO calculation, so model and tag renames or deprecations show up here
+    # only after the next run.
+    leaderboard_view = schema.scoring.model_leaderboard_view
     query = (
-        select(ModelLeaderboard)
-        .join(Model, ModelLeaderboard.model_id == Model.id)
-        .join(ExperimentalState, Model.experimental_state_id == ExperimentalState.id, isouter=True)
+        select(leaderboard_view)
         .where(
-            ModelLeaderboard.metric_id == metric.id,
-            ModelLeaderboard.test_set_id == test_set.id,
-            ModelLeaderboard.vote_count >= minVotes,
-            (ExperimentalState.name.is_(None) | (ExperimentalState.name != 'DEPRECATED'))
+            leaderboard_view.c.metric_id == metric.id,
+            leaderboard_view.c.test_set_id == test_set.id,
+            leaderboard_view.c.vote_count >= minVotes,
         )
-        .order_by(ModelLeaderboard.elo_score.desc())
+        .order_by(leaderboard_view.c.elo_score.desc())
         .limit(limit)
     )
 
     # Add tag filter if tagName is provided
     if tagName:
-        query = query.where(ModelLeaderboard.tag_id == tag.id)
+        query = query.where(leaderboard_view.c.tag_id == tag.id)
     else:
-        query = query.where(ModelLeaderboard.tag_id == None)
+        query = query.where(leaderboard_view.c.tag_id == None)
 
     # Execute query
-    entries = db.scalars(query).all()
+    entries = db.execute(query).all()
 
     # Transform entries to response format
     leaderboard_entries = []
     for entry in entries:
         model_data = ModelResponse(
-            id=entry.model.external_id, name=entry.model.name, slug=entry.model.slug
+            id=entry.model_external_id, name=entry.model_name, slug=entry.model_slug
         )
 
         tag_data = None
-        if entry.tag:
-            tag_data = TagResponse(id=entry.tag.external_id, name=entry.tag.name)
+        if entry.tag_id is not None:
+            tag_data = TagResponse(id=entry.tag_external_id, name=entry.tag_name)
 
         leaderboard_entries.append(
             LeaderboardEntryResponse(
@@ -1083,7 +1076,7 @@ def view_sample(
         ArtifactResponse(
             id=artifact.external_id,
             kind=artifact.kind.name,
-            bucket=artifact.bucket,
+            bucket=artifact.bucket.name,
             key=artifact.key,
         )
         for artifact in sample.artifacts
@@ -118,7 +118,7 @@ def _validate_emails(db: Session, emails: List[str]):
         )
 
 
-def _hash_emails(salt: str, emails: List[str]) -> List[str]:
+def _hash_emails(salt: str, emails: List[str]) -> List[bytes]:
     return [hash_email(email, salt) for email in emails]
 
 
@@ -143,9 +143,9 @@ def signup(request: SignupRequest, db: Session = Depends(get_managed_session)):
     hashed_emails = _hash_emails(settings.EMAIL_SALT, authentication_payload.emails)
 
     user_stmt = (
-        select(AuthProviderEmailHash)
-        .join(AuthProvider)
-        .where(sqlalchemy.and_(AuthProviderEmailHash.email_hash.in_(hashed_emails)))
+        select(AuthProviderEmailHash.user_id)
+        .where(AuthProviderEmailHash.email_hash.in_(hashed_emails))
+        .limit(1)
     )
 
     registered_emails = list(db.scalars(user_stmt))
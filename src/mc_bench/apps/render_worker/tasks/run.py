@@ -9,8 +9,9 @@ from mc_bench.minecraft.rendering import Renderer, TimeOfDay
 from mc_bench.minecraft.resources import ResourceLoader
 from mc_bench.minecraft.schematic import load_schematic, to_minecraft_world
 from mc_bench.models.log import SampleObservation
-from mc_bench.models.run import Artifact, RenderingSample
+from mc_bench.models.run import Artifact, RenderingSample, bucket_for
 from mc_bench.models.user import User
+from mc_bench.schema.object_store.runs import path_for
 from mc_bench.util.logging import get_logger
 from mc_bench.util.object_store import get_client as get_object_store_client
 from mc_bench.worker.run_stage import StageContext, run_stage_task
@@ -145,9 +146,10 @@ def render_sample(stage_context: StageContext):
         for key in ["rendered_model_glb"]:
             object_client.fput_object(
                 bucket_name=settings.INTERNAL_OBJECT_BUCKET,
-                object_name=render_artifact_spec[key]["object_prototype"]
-                .materialize(**render_artifact_spec[key]["object_parts"])
-                .get_path(),
+                object_name=path_for(
+                    render_artifact_spec[key]["object_kind"],
+                    **render_artifact_spec[key]["object_parts"],
+                ),
                 file_path=rendered_model_glb_filepath,
             )
 
@@ -156,10 +158,8 @@ def render_sample(stage_context: StageContext):
                 kind=spec["artifact_kind"],
                 run_id=stage_context.run.id,
                 sample_id=stage_context.sample.id,
-                bucket=settings.INTERNAL_OBJECT_BUCKET,
-                key=spec["object_prototype"]
-                .materialize(**spec["object_parts"])
-                .get_path(),
+                bucket=bucket_for(stage_context.db, settings.INTERNAL_OBJECT_BUCKET),
+                key=path_for(spec["object_kind"], **spec["object_parts"]),
             )
             stage_context.db.add(artifact)
         stage_context.db.commit()
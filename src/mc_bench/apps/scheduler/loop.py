@@ -5,7 +5,7 @@ import sys
 import time
 from typing import Dict, List
 
-from jose import jwt
+import jwt
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session, selectinload
 
@@ -119,7 +119,7 @@ def get_pending_runs_for_stage_id(
             | (Run.state_id == run_state_id_for(db, RUN_STATE.IN_RETRY))
         )
         .filter(Run.id.in_(pending_stage_runs))
-        .options(selectinload(Run.stages))
+        .options(selectinload(Run.stages), selectinload(Run.samples))
         .with_for_update(skip_locked=True)
     )
 
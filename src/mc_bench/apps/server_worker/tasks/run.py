@@ -18,7 +18,9 @@ from mc_bench.models.run import (
     Artifact,
     Building,
     ExportingContent,
+    bucket_for,
 )
+from mc_bench.schema.object_store.runs import path_for
 from mc_bench.util.docker import wait_for_containers
 from mc_bench.util.logging import get_logger
 from mc_bench.util.object_store import get_client
@@ -180,9 +182,10 @@ def build_structure(stage_context: StageContext):
     for file_key in ["schematic", "command_list", "build_summary"]:
         object_client.fput_object(
             bucket_name=settings.INTERNAL_OBJECT_BUCKET,
-            object_name=file_spec[file_key]["object_prototype"]
-            .materialize(**file_spec[file_key]["object_parts"])
-            .get_path(),
+            object_name=path_for(
+                file_spec[file_key]["object_kind"],
+                **file_spec[file_key]["object_parts"],
+            ),
             file_path=os.path.join(
                 file_spec[file_key]["host_path_directory"],
                 file_spec[file_key]["host_file"],
@@ -191,9 +194,10 @@ def build_structure(stage_context: StageContext):
 
     object_client.put_object(
         bucket_name=settings.INTERNAL_OBJECT_BUCKET,
-        object_name=file_spec["build_script"]["object_prototype"]
-        .materialize(**file_spec["build_script"]["object_parts"])
-        .get_path(),
+        object_name=path_for(
+            file_spec["build_script"]["object_kind"],
+            **file_spec["build_script"]["object_parts"],
+        ),
         data=BytesIO(build_script.encode("utf-8")),
         length=len(build_script.encode("utf-8")),
     )
@@ -203,8 +207,8 @@ def build_structure(stage_context: StageContext):
             kind=spec["artifact_kind"],
             run_id=run_id,
             sample_id=sample_id,
-            bucket=settings.INTERNAL_OBJECT_BUCKET,
-            key=spec["object_prototype"].materialize(**spec["object_parts"]).get_path(),
+            bucket=bucket_for(stage_context.db, settings.INTERNAL_OBJECT_BUCKET),
+            key=path_for(spec["object_kind"], **spec["object_parts"]),
         )
         stage_context.db.add(artifact)
     stage_context.db.commit()
@@ -375,9 +379,10 @@ def export_structure_views(stage_context: StageContext):
 
     object_client.put_object(
         bucket_name=settings.INTERNAL_OBJECT_BUCKET,
-        object_name=file_spec["command_list_build_script"]["object_prototype"]
-        .materialize(**file_spec["command_list_build_script"]["object_parts"])
-        .get_path(),
+        object_name=path_for(
+            file_spec["command_list_build_script"]["object_kind"],
+            **file_spec["command_list_build_script"]["object_parts"],
+        ),
         data=BytesIO(export_script.encode("utf-8")),
         length=len(export_script.encode("utf-8")),
     )
@@ -391,9 +396,9 @@ def export_structure_views(stage_context: StageContext):
     ]:
         object_client.fput_object(
             bucket_name=settings.INTERNAL_OBJECT_BUCKET,
-            object_name=file_spec[key]["object_prototype"]
-            .materialize(**file_spec[key]["object_parts"])
-            .get_path(),
+            object_name=path_for(
+                file_spec[key]["object_kind"], **file_spec[key]["object_parts"]
+            ),
             file_path=os.path.join(
                 file_spec[key]["host_path_directory"],
                 file_spec[key]["host_file"],
@@ -405,8 +410,8 @@ def export_structure_views(stage_context: StageContext):
             kind=spec["artifact_kind"],
             run_id=run_id,
             sample_id=sample_id,
-            bucket=settings.INTERNAL_OBJECT_BUCKET,
-            key=spec["object_prototype"].materialize(**spec["object_parts"]).get_path(),
+            bucket=bucket_for(stage_context.db, settings.INTERNAL_OBJECT_BUCKET),
+            key=path_for(spec["object_kind"], **spec["object_parts"]),
         )
         stage_context.db.add(artifact)
 
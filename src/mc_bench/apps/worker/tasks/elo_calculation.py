@@ -263,6 +263,12 @@ def process_comparison_for_elo(db, comparison_id):
 
     # SIMPLIFIED PROCESSING OF WIN/LOSS OR TIE
 
+    # Read the settings once rather than for every rating update below. The
+    # expected scores of the two sides of a pair always sum to one, so only one
+    # of them is computed.
+    k_factor = settings.ELO_K_FACTOR
+    min_score = settings.ELO_MIN_SCORE
+
     # Handle tie case
     if is_tie:
         # Get the samples that tied (all samples have the same rank)
@@ -304,7 +310,7 @@ def process_comparison_for_elo(db, comparison_id):
                 sample_b_rating = sample_entries[sample_b_key].elo_score
 
                 sample_a_expected = expected_score(sample_a_rating, sample_b_rating)
-                sample_b_expected = expected_score(sample_b_rating, sample_a_rating)
+                sample_b_expected = 1.0 - sample_a_expected
 
                 # Tie scores
                 sample_a_actual = 0.5
@@ -315,15 +321,15 @@ def process_comparison_for_elo(db, comparison_id):
                     sample_a_rating,
                     sample_a_expected,
                     sample_a_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
                 sample_b_new_rating = update_elo(
                     sample_b_rating,
                     sample_b_expected,
                     sample_b_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
 
                 sample_entries[sample_a_key].elo_score = sample_a_new_rating
@@ -360,7 +366,7 @@ def process_comparison_for_elo(db, comparison_id):
                 model_b_rating = model_entries[model_b_key].elo_score
 
                 model_a_expected = expected_score(model_a_rating, model_b_rating)
-                model_b_expected = expected_score(model_b_rating, model_a_rating)
+                model_b_expected = 1.0 - model_a_expected
 
                 # Tie scores
                 model_a_actual = 0.5
@@ -371,15 +377,15 @@ def process_comparison_for_elo(db, comparison_id):
                     model_a_rating,
                     model_a_expected,
                     model_a_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
                 model_b_new_rating = update_elo(
                     model_b_rating,
                     model_b_expected,
                     model_b_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
 
                 model_entries[model_a_key].elo_score = model_a_new_rating
@@ -419,7 +425,7 @@ def process_comparison_for_elo(db, comparison_id):
                 prompt_b_rating = prompt_entries[prompt_b_key].elo_score
 
                 prompt_a_expected = expected_score(prompt_a_rating, prompt_b_rating)
-                prompt_b_expected = expected_score(prompt_b_rating, prompt_a_rating)
+                prompt_b_expected = 1.0 - prompt_a_expected
 
                 # Tie scores
                 prompt_a_actual = 0.5
@@ -430,15 +436,15 @@ def process_comparison_for_elo(db, comparison_id):
                     prompt_a_rating,
                     prompt_a_expected,
                     prompt_a_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
                 prompt_b_new_rating = update_elo(
                     prompt_b_rating,
                     prompt_b_expected,
                     prompt_b_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
 
                 prompt_entries[prompt_a_key].elo_score = prompt_a_new_rating
@@ -491,24 +497,22 @@ def process_comparison_for_elo(db, comparison_id):
                     tag_model_a_expected = expected_score(
                         tag_model_a_rating, tag_model_b_rating
                     )
-                    tag_model_b_expected = expected_score(
-                        tag_model_b_rating, tag_model_a_rating
-                    )
+                    tag_model_b_expected = 1.0 - tag_model_a_expected
 
                     # Update ELO scores
                     tag_model_a_new_rating = update_elo(
                         tag_model_a_rating,
                         tag_model_a_expected,
                         0.5,  # tie
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
                     tag_model_b_new_rating = update_elo(
                         tag_model_b_rating,
                         tag_model_b_expected,
                         0.5,  # tie
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
 
                     model_entries[tag_model_a_key].elo_score = tag_model_a_new_rating
@@ -545,24 +549,22 @@ def process_comparison_for_elo(db, comparison_id):
                     tag_prompt_a_expected = expected_score(
                         tag_prompt_a_rating, tag_prompt_b_rating
                     )
-                    tag_prompt_b_expected = expected_score(
-                        tag_prompt_b_rating, tag_prompt_a_rating
-                    )
+                    tag_prompt_b_expected = 1.0 - tag_prompt_a_expected
 
                     # Update ELO scores
                     tag_prompt_a_new_rating = update_elo(
                         tag_prompt_a_rating,
                         tag_prompt_a_expected,
                         0.5,  # tie
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
                     tag_prompt_b_new_rating = update_elo(
                         tag_prompt_b_rating,
                         tag_prompt_b_expected,
                         0.5,  # tie
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
 
                     prompt_entries[tag_prompt_a_key].elo_score = tag_prompt_a_new_rating
@@ -602,7 +604,7 @@ def process_comparison_for_elo(db, comparison_id):
                 loser_rating = sample_entries[loser_key].elo_score
 
                 winner_expected = expected_score(winner_rating, loser_rating)
-                loser_expected = expected_score(loser_rating, winner_rating)
+                loser_expected = 1.0 - winner_expected
 
                 # Win/loss scores
                 winner_actual = 1.0
@@ -613,15 +615,15 @@ def process_comparison_for_elo(db, comparison_id):
                     winner_rating,
                     winner_expected,
                     winner_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
                 loser_new_rating = update_elo(
                     loser_rating,
                     loser_expected,
                     loser_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
 
                 sample_entries[winner_key].elo_score = winner_new_rating
@@ -660,9 +662,7 @@ def process_comparison_for_elo(db, comparison_id):
                 winner_model_expected = expected_score(
                     winner_model_rating, loser_model_rating
                 )
-                loser_model_expected = expected_score(
-                    loser_model_rating, winner_model_rating
-                )
+                loser_model_expected = 1.0 - winner_model_expected
 
                 # Win/loss scores
                 winner_model_actual = 1.0
@@ -673,15 +673,15 @@ def process_comparison_for_elo(db, comparison_id):
                     winner_model_rating,
                     winner_model_expected,
                     winner_model_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
                 loser_model_new_rating = update_elo(
                     loser_model_rating,
                     loser_model_expected,
                     loser_model_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
 
                 model_entries[winner_model_key].elo_score = winner_model_new_rating
@@ -722,9 +722,7 @@ def process_comparison_for_elo(db, comparison_id):
                 winner_prompt_expected = expected_score(
                     winner_prompt_rating, loser_prompt_rating
                 )
-                loser_prompt_expected = expected_score(
-                    loser_prompt_rating, winner_prompt_rating
-                )
+                loser_prompt_expected = 1.0 - winner_prompt_expected
 
                 # Win/loss scores
                 winner_prompt_actual = 1.0
@@ -735,15 +733,15 @@ def process_comparison_for_elo(db, comparison_id):
                     winner_prompt_rating,
                     winner_prompt_expected,
                     winner_prompt_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
                 loser_prompt_new_rating = update_elo(
                     loser_prompt_rating,
                     loser_prompt_expected,
                     loser_prompt_actual,
-                    settings.ELO_K_FACTOR,
-                    settings.ELO_MIN_SCORE,
+                    k_factor,
+                    min_score,
                 )
 
                 prompt_entries[winner_prompt_key].elo_score = winner_prompt_new_rating
@@ -800,24 +798,22 @@ def process_comparison_for_elo(db, comparison_id):
                     tag_winner_model_expected = expected_score(
                         tag_winner_model_rating, tag_loser_model_rating
                     )
-                    tag_loser_model_expected = expected_score(
-                        tag_loser_model_rating, tag_winner_model_rating
-                    )
+                    tag_loser_model_expected = 1.0 - tag_winner_model_expected
 
                     # Update ELO scores
                     tag_winner_model_new_rating = update_elo(
                         tag_winner_model_rating,
                         tag_winner_model_expected,
                         1.0,  # win
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
                     tag_loser_model_new_rating = update_elo(
                         tag_loser_model_rating,
                         tag_loser_model_expected,
                         0.0,  # loss
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
 
                     model_entries[
@@ -862,24 +858,22 @@ def process_comparison_for_elo(db, comparison_id):
                     tag_winner_prompt_expected = expected_score(
                         tag_winner_prompt_rating, tag_loser_prompt_rating
                     )
-                    tag_loser_prompt_expected = expected_score(
-                        tag_loser_prompt_rating, tag_winner_prompt_rating
-                    )
+                    tag_loser_prompt_expected = 1.0 - tag_winner_prompt_expected
 
                     # Update ELO scores
                     tag_winner_prompt_new_rating = update_elo(
                         tag_winner_prompt_rating,
                         tag_winner_prompt_expected,
                         1.0,  # win
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
                     tag_loser_prompt_new_rating = update_elo(
                         tag_loser_prompt_rating,
                         tag_loser_prompt_expected,
                         0.0,  # loss
-                        settings.ELO_K_FACTOR,
-                        settings.ELO_MIN_SCORE,
+                        k_factor,
+                        min_score,
                     )
 
                     prompt_entries[
@@ -901,8 +895,7 @@ def process_comparison_for_elo(db, comparison_id):
     for entry in sample_entries.values():
         entry.last_updated = now
 
-    # Commit all changes
-    db.commit()
+    # The caller commits, once per batch
     return True
 
 
@@ -970,12 +963,15 @@ def elo_calculation():
 
                 for comparison_id in unprocessed_comparison_ids:
                     try:
-                        # Process the comparison
-                        process_comparison_for_elo(db, comparison_id)
+                        # Each comparison gets a savepoint, so a failure only discards
+                        # its own updates while the batch stays one transaction (and
+                        # keeps holding the table locks above)
+                        with db.begin_nested():
+                            # Process the comparison
+                            process_comparison_for_elo(db, comparison_id)
 
-                        # Mark as processed
-                        db.add(ProcessedComparison(comparison_id=comparison_id))
-                        db.commit()
+                            # Mark as processed
+                            db.add(ProcessedComparison(comparison_id=comparison_id))
 
                         batch_processed += 1
                         if batch_processed % 100 == 0:
@@ -988,7 +984,9 @@ def elo_calculation():
                         logger.error(
                             f"Error processing comparison {comparison_id}: {e}"
                         )
-                        db.rollback()  # Rollback on error
+
+                # Write the whole batch in one commit
+                db.commit()
 
                 logger.info(
                     f"Batch completed. Processed: {batch_processed}, Errors: {batch_errors}"
@@ -996,6 +994,18 @@ def elo_calculation():
                 total_processed += batch_processed
                 total_errors += batch_errors
 
+        # The leaderboard API reads from the materialized view. Refresh it even if
+        # nothing was processed so model deprecations still show up. The function
+        # refreshes CONCURRENTLY, with the view owner's rights, so the view stays
+        # readable while it runs.
+        logger.info("Refreshing model leaderboard view")
+        try:
+            with managed_session() as db:
+                db.execute(text("SELECT scoring.refresh_model_leaderboard_view()"))
+        except Exception as e:
+            # The batches are already committed; the view catches up on the next run
+            logger.error(f"Error refreshing model leaderboard view: {e}")
+
         logger.info(
             f"All ELO calculations completed. Total processed: {total_processed}, Total errors: {total_errors}"
         )
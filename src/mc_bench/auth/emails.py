@@ -1,9 +1,12 @@
 import hashlib
 
 
-def hash_email(email: str, salt: str) -> str:
+def hash_email(email: str, salt: str) -> bytes:
     """
     Hash an email address using SHA-256 with salt from environment.
+
+    Returns the raw 32 byte digest, which is what `auth_provider_email_hash.email_hash`
+    stores.
     """
     if not salt:
         raise ValueError("salt must have some contents")
@@ -13,4 +16,4 @@ def hash_email(email: str, salt: str) -> str:
     hasher = hashlib.sha256()
     hasher.update(salt.encode("utf-8"))
     hasher.update(normalized.encode("utf-8"))
-    return hasher.digest().hex()
+    return hasher.digest()
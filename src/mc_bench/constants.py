@@ -42,6 +42,11 @@ class STAGE(enum.Enum):
     PREPARING_SAMPLE = "PREPARING_SAMPLE"
 
 
+class SAMPLE_APPROVAL_STATE(enum.Enum):
+    APPROVED = "APPROVED"
+    REJECTED = "REJECTED"
+
+
 class EXPERIMENTAL_STATE(enum.Enum):
     DRAFT = "DRAFT"
     IN_REVIEW = "IN_REVIEW"
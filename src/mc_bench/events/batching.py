@@ -0,0 +1,169 @@
+"""
+Coalesce state change events into batched UPDATE statements.
+"""
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import BigInteger, Table, column, func, values
+
+import mc_bench.util.postgres as postgres
+from mc_bench.util.logging import get_logger
+
+from .types import Event
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class _Target:
+    table: Table
+    id_field: str
+    state_id_for: Callable[[Any, Any], int]
+    touch_last_modified: bool
+
+
+def batch_update_state(
+    db,
+    table: Table,
+    pairs: List[Tuple[int, int]],
+    touch_last_modified: bool = False,
+) -> None:
+    """
+    Set `state_id` for many rows of `table` in a single statement.
+
+    Emits `UPDATE ... SET state_id = v.state_id FROM (VALUES ...) AS v(id, state_id)
+    WHERE table.id = v.id`, so rows moving to different states still share one round
+    trip.
+
+    Args:
+        db: The session to execute on
+        table: The table to update
+        pairs: (row id, state id) pairs
+        touch_last_modified: Whether to also set `last_modified` to the database time
+    """
+    if not pairs:
+        return
+
+    new_state = values(
+        column("id", BigInteger),
+        column("state_id", BigInteger),
+        name="new_state",
+    ).data(pairs)
+
+    update_values = {"state_id": new_state.c.state_id}
+    if touch_last_modified:
+        # Use database time for last_modified
+        update_values["last_modified"] = func.now()
+
+    db.execute(
+        table.update().where(table.c.id == new_state.c.id).values(**update_values)
+    )
+
+
+class StateChangeBatcher:
+    """
+    Buffers state change events and writes them to the database in batches.
+
+    Only the latest state for each row is kept, so a row is updated at most once
+    per flush. Each flush runs in a single transaction and issues one UPDATE per
+    table (see `batch_update_state`) instead of one session and UPDATE per event.
+    """
+
+    def __init__(self, flush_interval: float = 0.05):
+        self.flush_interval = flush_interval
+        self._targets: Dict[Type[Event], _Target] = {}
+        self._pending: Dict[Type[Event], Dict[int, Any]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(
+        self,
+        event_type: Type[Event],
+        table: Table,
+        id_field: str,
+        state_id_for: Callable[[Any, Any], int],
+        touch_last_modified: bool = False,
+    ) -> None:
+        """
+        Route events of `event_type` to `table`.
+
+        Args:
+            event_type: The event class to batch
+            table: The table whose `state_id` column is updated
+            id_field: The event attribute holding the row id
+            state_id_for: Resolves the event's `new_state` to a state id, given a session
+            touch_last_modified: Whether to also set `last_modified` to the database time
+        """
+        self._targets[event_type] = _Target(
+            table=table,
+            id_field=id_field,
+            state_id_for=state_id_for,
+            touch_last_modified=touch_last_modified,
+        )
+
+    def handle(self, event: Event) -> None:
+        """Event handler; buffers the event until the next flush"""
+        event_type = type(event)
+        target = self._targets[event_type]
+        with self._lock:
+            self._pending[event_type][getattr(event, target.id_field)] = event.new_state
+
+    def flush(self) -> None:
+        """Write all buffered state changes in one transaction"""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(dict)
+
+        if not any(pending.values()):
+            return
+
+        try:
+            with postgres.managed_session() as db:
+                for event_type, new_states in pending.items():
+                    self._apply(db, self._targets[event_type], new_states)
+        except Exception:
+            # Put the changes back unless a newer state arrived in the meantime
+            with self._lock:
+                for event_type, new_states in pending.items():
+                    for row_id, new_state in new_states.items():
+                        self._pending[event_type].setdefault(row_id, new_state)
+            raise
+
+    def _apply(self, db, target: _Target, new_states: Dict[int, Any]) -> None:
+        batch_update_state(
+            db,
+            target.table,
+            [
+                (row_id, target.state_id_for(db, new_state))
+                for row_id, new_state in new_states.items()
+            ],
+            touch_last_modified=target.touch_last_modified,
+        )
+
+    def start(self) -> None:
+        """Start flushing in a background thread every `flush_interval` seconds"""
+        if self._thread is not None:
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and flush anything still buffered"""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush state changes")
@@ -0,0 +1,86 @@
+"""model_leaderboard_view
+
+Revision ID: 2a7f4c9e0d63
+Revises: 8e5d3a7c1b49
+Create Date: 2025-03-13 16:05:12.771620
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2a7f4c9e0d63"
+down_revision: Union[str, None] = "8e5d3a7c1b49"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW scoring.model_leaderboard_view AS
+        SELECT
+            ml.id,
+            ml.model_id,
+            ml.metric_id,
+            ml.test_set_id,
+            ml.tag_id,
+            ml.elo_score,
+            ml.vote_count,
+            ml.win_count,
+            ml.loss_count,
+            ml.tie_count,
+            ml.last_updated,
+            m.external_id AS model_external_id,
+            m.name AS model_name,
+            m.slug AS model_slug,
+            t.external_id AS tag_external_id,
+            t.name AS tag_name
+        FROM scoring.model_leaderboard ml
+        JOIN specification.model m ON m.id = ml.model_id
+        LEFT JOIN research.experimental_state es ON es.id = m.experimental_state_id
+        LEFT JOIN specification.tag t ON t.id = ml.tag_id
+        WHERE es.name IS NULL OR es.name != 'DEPRECATED'
+    """)
+    # REFRESH MATERIALIZED VIEW CONCURRENTLY needs a unique index
+    op.create_index(
+        "uq_model_leaderboard_view_id",
+        "model_leaderboard_view",
+        ["id"],
+        unique=True,
+        schema="scoring",
+    )
+    op.execute("""
+        CREATE INDEX ix_model_leaderboard_view_metric_test_set_tag_elo
+        ON scoring.model_leaderboard_view (metric_id, test_set_id, tag_id, elo_score DESC)
+        INCLUDE (vote_count)
+    """)
+    # Only the view's owner may refresh it, but the ELO worker connects as "worker".
+    # This function runs with the owner's rights so the worker can refresh the view
+    # without being granted ownership of it.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION scoring.refresh_model_leaderboard_view()
+        RETURNS void
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = pg_catalog, pg_temp
+        AS $$
+        BEGIN
+            REFRESH MATERIALIZED VIEW CONCURRENTLY scoring.model_leaderboard_view;
+        END
+        $$
+    """)
+    op.execute("""
+        ALTER FUNCTION scoring.refresh_model_leaderboard_view() OWNER TO "mc-bench-admin";
+        REVOKE EXECUTE ON FUNCTION scoring.refresh_model_leaderboard_view() FROM PUBLIC;
+        -- The scoring default privileges grant EXECUTE on new functions to these too
+        REVOKE EXECUTE ON FUNCTION scoring.refresh_model_leaderboard_view() FROM "api", "admin-api";
+        GRANT EXECUTE ON FUNCTION scoring.refresh_model_leaderboard_view() TO "worker";
+    """)
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.execute("DROP FUNCTION scoring.refresh_model_leaderboard_view()")
+    op.execute("DROP MATERIALIZED VIEW scoring.model_leaderboard_view")
@@ -0,0 +1,41 @@
+"""add_brin_uit_last_used_at
+
+Revision ID: 3b8e0d47c2a5
+Revises: 9f6b2d8e5a13
+Create Date: 2025-03-12 17:26:40.902178
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e0d47c2a5"
+down_revision: Union[str, None] = "9f6b2d8e5a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "brin_uit_last_used_at",
+            "user_identification_token",
+            ["last_used_at"],
+            unique=False,
+            schema="auth",
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.drop_index(
+        "brin_uit_last_used_at",
+        table_name="user_identification_token",
+        schema="auth",
+    )
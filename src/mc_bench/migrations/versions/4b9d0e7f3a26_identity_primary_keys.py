@@ -0,0 +1,60 @@
+"""identity_primary_keys
+
+Revision ID: 4b9d0e7f3a26
+Revises: a3c6e1f8b054
+Create Date: 2025-03-14 13:20:47.652391
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b9d0e7f3a26"
+down_revision: Union[str, None] = "a3c6e1f8b054"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose serial "id" becomes GENERATED BY DEFAULT AS IDENTITY
+TABLES = [
+    "scoring.metric",
+    "scoring.model_leaderboard",
+    "scoring.prompt_leaderboard",
+    "scoring.sample_approval_state",
+    "scoring.sample_leaderboard",
+    "specification.generation",
+    "specification.provider",
+    "specification.provider_class",
+    "specification.run_stage_state",
+    "specification.run_state",
+    "specification.tag",
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        # Swap the serial's sequence for an identity, carrying on from the highest
+        # id so existing rows (including ones inserted with explicit ids) don't clash
+        op.execute(f"""
+            DO $$
+            DECLARE
+                serial_sequence text := pg_get_serial_sequence('{table}', 'id');
+                next_id bigint;
+            BEGIN
+                ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+                EXECUTE format('DROP SEQUENCE %s', serial_sequence);
+                ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY;
+
+                SELECT coalesce(max(id), 0) + 1 INTO next_id FROM {table};
+                EXECUTE format(
+                    'ALTER TABLE {table} ALTER COLUMN id RESTART WITH %s', next_id
+                );
+            END
+            $$
+        """)
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
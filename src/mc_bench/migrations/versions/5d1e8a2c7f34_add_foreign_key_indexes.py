@@ -0,0 +1,98 @@
+"""add_foreign_key_indexes
+
+Revision ID: 5d1e8a2c7f34
+Revises: 473407e9d86e
+Create Date: 2025-03-12 10:14:52.318604
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1e8a2c7f34"
+down_revision: Union[str, None] = "473407e9d86e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, schema)
+INDEXES = [
+    ("ix_user_role_role_id", "user_role", ["role_id"], "auth"),
+    ("ix_role_permission_permission_id", "role_permission", ["permission_id"], "auth"),
+    (
+        "ix_auth_provider_email_hash_user_id",
+        "auth_provider_email_hash",
+        ["user_id"],
+        "auth",
+    ),
+    ("ix_artifact_run_id", "artifact", ["run_id"], "sample"),
+    ("ix_artifact_artifact_kind_id", "artifact", ["artifact_kind_id"], "sample"),
+    ("ix_comparison_user_id", "comparison", ["user_id"], "scoring"),
+    (
+        "ix_comparison_identification_token_id",
+        "comparison",
+        ["identification_token_id"],
+        "scoring",
+    ),
+    ("ix_comparison_session_id", "comparison", ["session_id"], "scoring"),
+    (
+        "ix_template_experimental_state_proposal_template_id",
+        "template_experimental_state_proposal",
+        ["template_id"],
+        "research",
+    ),
+    (
+        "ix_template_experimental_state_proposal_new_experiment_state_id",
+        "template_experimental_state_proposal",
+        ["new_experiment_state_id"],
+        "research",
+    ),
+    (
+        "ix_template_experimental_state_proposal_log_id",
+        "template_experimental_state_proposal",
+        ["log_id"],
+        "research",
+    ),
+    (
+        "ix_template_experimental_state_proposal_accepted_by",
+        "template_experimental_state_proposal",
+        ["accepted_by"],
+        "research",
+    ),
+    (
+        "ix_template_experimental_state_proposal_rejected_by",
+        "template_experimental_state_proposal",
+        ["rejected_by"],
+        "research",
+    ),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, schema in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    with op.get_context().autocommit_block():
+        for name, table, _, schema in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,105 @@
+"""uuidv7_external_ids
+
+Revision ID: 5f0b8d2e6a71
+Revises: 2a7f4c9e0d63
+Create Date: 2025-03-13 17:48:26.390215
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f0b8d2e6a71"
+down_revision: Union[str, None] = "2a7f4c9e0d63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (schema, table, column) for every indexed uuid that moves to time-ordered ids.
+# user_identification_token.token and sample.comparison_sample_id stay random.
+UUID_V7_COLUMNS = [
+    ("auth", "role", "external_id"),
+    ("auth", "user", "external_id"),
+    ("research", "experimental_state", "external_id"),
+    ("research", "log", "external_id"),
+    ("research", "model_experimental_state_proposal", "external_id"),
+    ("research", "note", "external_id"),
+    ("research", "prompt_experimental_state_proposal", "external_id"),
+    ("research", "template_experimental_state_proposal", "external_id"),
+    ("sample", "artifact", "external_id"),
+    ("sample", "sample", "external_id"),
+    ("sample", "test_set", "external_id"),
+    ("scoring", "comparison", "comparison_id"),
+    ("scoring", "metric", "external_id"),
+    ("specification", "generation", "external_id"),
+    ("specification", "generation_state", "external_id"),
+    ("specification", "model", "external_id"),
+    ("specification", "prompt", "external_id"),
+    ("specification", "provider", "external_id"),
+    ("specification", "provider_class", "external_id"),
+    ("specification", "run", "external_id"),
+    ("specification", "run_stage", "external_id"),
+    ("specification", "run_stage_state", "external_id"),
+    ("specification", "run_state", "external_id"),
+    ("specification", "stage", "external_id"),
+    ("specification", "tag", "external_id"),
+    ("specification", "template", "external_id"),
+]
+
+
+def upgrade() -> None:
+    # Postgres 16 has no native uuidv7(). Start from a random v4 uuid (which already
+    # has the right variant bits), overlay the 48 bit unix millisecond timestamp and
+    # flip the version nibble from 4 to 7.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION public.uuid_generate_v7()
+        RETURNS uuid
+        LANGUAGE sql
+        VOLATILE
+        PARALLEL SAFE
+        AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            placing substring(
+                                int8send(
+                                    floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint
+                                )
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$
+    """)
+
+    for schema, table, column in UUID_V7_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text("uuid_generate_v7()"),
+            schema=schema,
+        )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    for schema, table, column in UUID_V7_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text("gen_random_uuid()"),
+            schema=schema,
+        )
+
+    op.execute("DROP FUNCTION public.uuid_generate_v7()")
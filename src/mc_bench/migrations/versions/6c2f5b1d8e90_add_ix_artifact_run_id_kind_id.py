@@ -0,0 +1,47 @@
+"""add_ix_artifact_run_id_kind_id
+
+Revision ID: 6c2f5b1d8e90
+Revises: d41c7a9e6b28
+Create Date: 2025-03-13 10:41:05.227961
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6c2f5b1d8e90"
+down_revision: Union[str, None] = "d41c7a9e6b28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_artifact_run_id_kind_id",
+            "artifact",
+            ["run_id", "artifact_kind_id"],
+            unique=False,
+            schema="sample",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the composite index above
+        op.drop_index(
+            "ix_artifact_run_id",
+            table_name="artifact",
+            schema="sample",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.create_index(
+        "ix_artifact_run_id", "artifact", ["run_id"], unique=False, schema="sample"
+    )
+    op.drop_index("ix_artifact_run_id_kind_id", table_name="artifact", schema="sample")
@@ -0,0 +1,53 @@
+"""provider_config_jsonb
+
+Revision ID: 71d4b9e2a0c8
+Revises: e8a1f6c4d297
+Create Date: 2025-03-14 10:37:21.095516
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "71d4b9e2a0c8"
+down_revision: Union[str, None] = "e8a1f6c4d297"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Model registration used to json.dumps() the config before handing it to a JSON
+    # column, storing a JSON string that holds the object. Unwrap those while
+    # converting so every row holds the object itself.
+    op.alter_column(
+        "provider",
+        "config",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="""
+            CASE
+                WHEN json_typeof(config) = 'string' THEN (config #>> '{}')::jsonb
+                ELSE config::jsonb
+            END
+        """,
+        schema="specification",
+    )
+    op.alter_column(
+        "provider_class",
+        "default_config",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        existing_server_default=sa.text("'{}'::jsonb"),
+        postgresql_using="default_config::jsonb",
+        schema="specification",
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
@@ -0,0 +1,78 @@
+"""use_gen_random_uuid
+
+Revision ID: 7a3c5e90d1f2
+Revises: e2b7f91a4c06
+Create Date: 2025-03-12 15:30:52.164487
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3c5e90d1f2"
+down_revision: Union[str, None] = "e2b7f91a4c06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (schema, table, column) for every uuid_generate_v4() server default
+UUID_DEFAULT_COLUMNS = [
+    ("auth", "role", "external_id"),
+    ("auth", "user", "external_id"),
+    ("auth", "user_identification_token", "token"),
+    ("research", "experimental_state", "external_id"),
+    ("research", "log", "external_id"),
+    ("research", "model_experimental_state_proposal", "external_id"),
+    ("research", "note", "external_id"),
+    ("research", "prompt_experimental_state_proposal", "external_id"),
+    ("research", "template_experimental_state_proposal", "external_id"),
+    ("sample", "artifact", "external_id"),
+    ("sample", "sample", "comparison_sample_id"),
+    ("sample", "sample", "external_id"),
+    ("sample", "test_set", "external_id"),
+    ("scoring", "comparison", "comparison_id"),
+    ("scoring", "metric", "external_id"),
+    ("specification", "generation", "external_id"),
+    ("specification", "generation_state", "external_id"),
+    ("specification", "model", "external_id"),
+    ("specification", "prompt", "external_id"),
+    ("specification", "provider", "external_id"),
+    ("specification", "provider_class", "external_id"),
+    ("specification", "run", "external_id"),
+    ("specification", "run_stage", "external_id"),
+    ("specification", "run_stage_state", "external_id"),
+    ("specification", "run_state", "external_id"),
+    ("specification", "scheduler_control", "id"),
+    ("specification", "stage", "external_id"),
+    ("specification", "tag", "external_id"),
+    ("specification", "template", "external_id"),
+]
+
+
+def upgrade() -> None:
+    for schema, table, column in UUID_DEFAULT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text("gen_random_uuid()"),
+            schema=schema,
+        )
+
+    # Fails rather than cascading if anything still depends on uuid-ossp
+    op.execute('DROP EXTENSION IF EXISTS "uuid-ossp"')
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
+
+    for schema, table, column in UUID_DEFAULT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text("uuid_generate_v4()"),
+            schema=schema,
+        )
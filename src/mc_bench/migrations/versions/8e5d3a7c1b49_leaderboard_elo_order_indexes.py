@@ -0,0 +1,85 @@
+"""leaderboard_elo_order_indexes
+
+Revision ID: 8e5d3a7c1b49
+Revises: 6c2f5b1d8e90
+Create Date: 2025-03-13 14:22:37.508114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e5d3a7c1b49"
+down_revision: Union[str, None] = "6c2f5b1d8e90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_model_leaderboard_metric_test_set_tag_elo",
+            "model_leaderboard",
+            ["metric_id", "test_set_id", "tag_id", sa.text("elo_score DESC")],
+            unique=False,
+            schema="scoring",
+            postgresql_include=["vote_count"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_sample_leaderboard_metric_test_set_elo",
+            "sample_leaderboard",
+            ["metric_id", "test_set_id", sa.text("elo_score DESC")],
+            unique=False,
+            schema="scoring",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the indexes above, which share their leading columns
+        op.drop_index(
+            "ix_model_leaderboard_metric_test_set_tag_vote",
+            table_name="model_leaderboard",
+            schema="scoring",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_sample_leaderboard_metric_test_set",
+            table_name="sample_leaderboard",
+            schema="scoring",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.create_index(
+        "ix_sample_leaderboard_metric_test_set",
+        "sample_leaderboard",
+        ["metric_id", "test_set_id"],
+        unique=False,
+        schema="scoring",
+    )
+    op.create_index(
+        "ix_model_leaderboard_metric_test_set_tag_vote",
+        "model_leaderboard",
+        ["metric_id", "test_set_id", "tag_id", "vote_count"],
+        unique=False,
+        schema="scoring",
+    )
+    op.drop_index(
+        "ix_sample_leaderboard_metric_test_set_elo",
+        table_name="sample_leaderboard",
+        schema="scoring",
+    )
+    op.drop_index(
+        "ix_model_leaderboard_metric_test_set_tag_elo",
+        table_name="model_leaderboard",
+        schema="scoring",
+    )
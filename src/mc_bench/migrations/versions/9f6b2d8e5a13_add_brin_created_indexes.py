@@ -0,0 +1,50 @@
+"""add_brin_created_indexes
+
+Revision ID: 9f6b2d8e5a13
+Revises: 7a3c5e90d1f2
+Create Date: 2025-03-12 16:48:03.551907
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9f6b2d8e5a13"
+down_revision: Union[str, None] = "7a3c5e90d1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "brin_comparison_created",
+            "comparison",
+            ["created"],
+            unique=False,
+            schema="scoring",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "brin_artifact_created",
+            "artifact",
+            ["created"],
+            unique=False,
+            schema="sample",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.drop_index("brin_artifact_created", table_name="artifact", schema="sample")
+    op.drop_index("brin_comparison_created", table_name="comparison", schema="scoring")
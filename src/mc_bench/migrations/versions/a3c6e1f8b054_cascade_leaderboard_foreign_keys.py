@@ -0,0 +1,100 @@
+"""cascade_leaderboard_foreign_keys
+
+Revision ID: a3c6e1f8b054
+Revises: 71d4b9e2a0c8
+Create Date: 2025-03-14 11:54:09.317742
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c6e1f8b054"
+down_revision: Union[str, None] = "71d4b9e2a0c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, referenced table) for every foreign key on the scoring.*_leaderboard
+# tables. The constraints were created unnamed, so they have Postgres' default names.
+FOREIGN_KEYS = [
+    ("model_leaderboard", "model_id", "specification.model"),
+    ("model_leaderboard", "metric_id", "scoring.metric"),
+    ("model_leaderboard", "test_set_id", "sample.test_set"),
+    ("model_leaderboard", "tag_id", "specification.tag"),
+    ("prompt_leaderboard", "prompt_id", "specification.prompt"),
+    ("prompt_leaderboard", "model_id", "specification.model"),
+    ("prompt_leaderboard", "metric_id", "scoring.metric"),
+    ("prompt_leaderboard", "test_set_id", "sample.test_set"),
+    ("prompt_leaderboard", "tag_id", "specification.tag"),
+    ("sample_leaderboard", "sample_id", "sample.sample"),
+    ("sample_leaderboard", "metric_id", "scoring.metric"),
+    ("sample_leaderboard", "test_set_id", "sample.test_set"),
+]
+
+
+def upgrade() -> None:
+    # Run outside the migration transaction so each statement commits (and drops its
+    # locks) on its own
+    with op.get_context().autocommit_block():
+        for table, column, referent in FOREIGN_KEYS:
+            name = f"{table}_{column}_fkey"
+            # Swap the constraint in one statement. NOT VALID skips checking existing
+            # rows while the table is locked; VALIDATE does that without blocking writes
+            op.execute(f"""
+                ALTER TABLE scoring.{table}
+                DROP CONSTRAINT {name},
+                ADD CONSTRAINT {name} FOREIGN KEY ({column})
+                    REFERENCES {referent} (id) ON DELETE CASCADE NOT VALID
+            """)
+            op.execute(f"ALTER TABLE scoring.{table} VALIDATE CONSTRAINT {name}")
+
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction either
+        op.create_index(
+            "ix_model_leaderboard_tag_id",
+            "model_leaderboard",
+            ["tag_id"],
+            unique=False,
+            schema="scoring",
+            postgresql_where=sa.text("tag_id IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_prompt_leaderboard_model_metric_test_set_tag",
+            "prompt_leaderboard",
+            ["model_id", "metric_id", "test_set_id", "tag_id"],
+            unique=False,
+            schema="scoring",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_prompt_leaderboard_tag_id",
+            "prompt_leaderboard",
+            ["tag_id"],
+            unique=False,
+            schema="scoring",
+            postgresql_where=sa.text("tag_id IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Nothing else leads with test_set_id, so deleting a test set would otherwise
+        # scan all three tables
+        for table in ("model_leaderboard", "prompt_leaderboard", "sample_leaderboard"):
+            op.create_index(
+                f"ix_{table}_test_set_id",
+                table,
+                ["test_set_id"],
+                unique=False,
+                schema="scoring",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
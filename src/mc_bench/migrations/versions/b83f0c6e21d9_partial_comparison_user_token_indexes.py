@@ -0,0 +1,90 @@
+"""partial_comparison_user_token_indexes
+
+Revision ID: b83f0c6e21d9
+Revises: 5d1e8a2c7f34
+Create Date: 2025-03-12 11:02:37.840215
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b83f0c6e21d9"
+down_revision: Union[str, None] = "5d1e8a2c7f34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comparison_user_id_nn",
+            "comparison",
+            ["user_id"],
+            unique=False,
+            schema="scoring",
+            postgresql_where=sa.text("user_id IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_comparison_token_id_nn",
+            "comparison",
+            ["identification_token_id"],
+            unique=False,
+            schema="scoring",
+            postgresql_where=sa.text("identification_token_id IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_comparison_user_id",
+            table_name="comparison",
+            schema="scoring",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_comparison_identification_token_id",
+            table_name="comparison",
+            schema="scoring",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comparison_identification_token_id",
+            "comparison",
+            ["identification_token_id"],
+            unique=False,
+            schema="scoring",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_comparison_user_id",
+            "comparison",
+            ["user_id"],
+            unique=False,
+            schema="scoring",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_comparison_token_id_nn",
+            table_name="comparison",
+            schema="scoring",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_comparison_user_id_nn",
+            table_name="comparison",
+            schema="scoring",
+            postgresql_concurrently=True,
+        )
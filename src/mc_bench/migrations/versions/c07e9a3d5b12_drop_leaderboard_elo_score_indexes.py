@@ -0,0 +1,45 @@
+"""drop_leaderboard_elo_score_indexes
+
+Revision ID: c07e9a3d5b12
+Revises: 5f0b8d2e6a71
+Create Date: 2025-03-13 18:31:44.602983
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c07e9a3d5b12"
+down_revision: Union[str, None] = "5f0b8d2e6a71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table) in the scoring schema. Every leaderboard query is scoped to a
+# metric and test set, so none of these are used.
+INDEXES = [
+    ("ix_model_leaderboard_elo_score", "model_leaderboard"),
+    ("ix_prompt_leaderboard_elo_score", "prompt_leaderboard"),
+    ("ix_sample_leaderboard_elo_score", "sample_leaderboard"),
+]
+
+
+def upgrade() -> None:
+    # DROP INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table in INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                schema="scoring",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    for name, table in INDEXES:
+        op.create_index(name, table, ["elo_score"], unique=False, schema="scoring")
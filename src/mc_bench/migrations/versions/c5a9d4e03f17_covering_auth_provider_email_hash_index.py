@@ -0,0 +1,54 @@
+"""covering_auth_provider_email_hash_index
+
+Revision ID: c5a9d4e03f17
+Revises: 0e4a71c93b58
+Create Date: 2025-03-12 13:21:44.016372
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a9d4e03f17"
+down_revision: Union[str, None] = "0e4a71c93b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build the replacement before dropping the constraint so uniqueness is
+    # enforced throughout
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_auth_provider_email_hash",
+            "auth_provider_email_hash",
+            ["email_hash", "auth_provider_id"],
+            unique=True,
+            schema="auth",
+            postgresql_include=["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_constraint(
+        "auth_provider_email_hash_auth_provider_id_email_hash_key",
+        "auth_provider_email_hash",
+        type_="unique",
+        schema="auth",
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.create_unique_constraint(
+        "auth_provider_email_hash_auth_provider_id_email_hash_key",
+        "auth_provider_email_hash",
+        ["auth_provider_id", "email_hash"],
+        schema="auth",
+    )
+    op.drop_index(
+        "uq_auth_provider_email_hash",
+        table_name="auth_provider_email_hash",
+        schema="auth",
+    )
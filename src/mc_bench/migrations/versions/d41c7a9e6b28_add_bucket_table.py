@@ -0,0 +1,91 @@
+"""add_bucket_table
+
+Revision ID: d41c7a9e6b28
+Revises: 3b8e0d47c2a5
+Create Date: 2025-03-13 09:52:17.318840
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41c7a9e6b28"
+down_revision: Union[str, None] = "3b8e0d47c2a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bucket",
+        sa.Column("id", sa.SmallInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column(
+            "created", sa.TIMESTAMP(), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+        schema="sample",
+    )
+    op.execute(
+        """
+        INSERT INTO sample.bucket (name)
+        SELECT DISTINCT bucket FROM sample.artifact
+        """
+    )
+
+    op.add_column(
+        "artifact",
+        sa.Column("bucket_id", sa.SmallInteger(), nullable=True),
+        schema="sample",
+    )
+    op.execute(
+        """
+        UPDATE sample.artifact
+        SET bucket_id = bucket.id
+        FROM sample.bucket
+        WHERE bucket.name = artifact.bucket
+        """
+    )
+    op.alter_column(
+        "artifact",
+        "bucket_id",
+        existing_type=sa.SmallInteger(),
+        nullable=False,
+        schema="sample",
+    )
+    op.create_foreign_key(
+        None,
+        "artifact",
+        "bucket",
+        ["bucket_id"],
+        ["id"],
+        source_schema="sample",
+        referent_schema="sample",
+    )
+    op.drop_column("artifact", "bucket", schema="sample")
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.add_column(
+        "artifact",
+        sa.Column("bucket", sa.String(), nullable=True),
+        schema="sample",
+    )
+    op.execute(
+        """
+        UPDATE sample.artifact
+        SET bucket = bucket.name
+        FROM sample.bucket
+        WHERE bucket.id = artifact.bucket_id
+        """
+    )
+    op.alter_column(
+        "artifact", "bucket", existing_type=sa.String(), nullable=False, schema="sample"
+    )
+    op.drop_column("artifact", "bucket_id", schema="sample")
+    op.drop_table("bucket", schema="sample")
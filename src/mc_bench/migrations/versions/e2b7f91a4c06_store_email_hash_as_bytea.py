@@ -0,0 +1,44 @@
+"""store_email_hash_as_bytea
+
+Revision ID: e2b7f91a4c06
+Revises: c5a9d4e03f17
+Create Date: 2025-03-12 14:05:09.773120
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7f91a4c06"
+down_revision: Union[str, None] = "c5a9d4e03f17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing hashes are hex encoded sha256 digests
+    op.alter_column(
+        "auth_provider_email_hash",
+        "email_hash",
+        existing_type=sa.String(),
+        type_=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="decode(email_hash, 'hex')",
+        schema="auth",
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
+    op.alter_column(
+        "auth_provider_email_hash",
+        "email_hash",
+        existing_type=sa.LargeBinary(length=32),
+        type_=sa.String(),
+        existing_nullable=False,
+        postgresql_using="encode(email_hash, 'hex')",
+        schema="auth",
+    )
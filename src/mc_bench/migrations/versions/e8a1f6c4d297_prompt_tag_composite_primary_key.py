@@ -0,0 +1,41 @@
+"""prompt_tag_composite_primary_key
+
+Revision ID: e8a1f6c4d297
+Revises: c07e9a3d5b12
+Create Date: 2025-03-14 09:12:58.843107
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8a1f6c4d297"
+down_revision: Union[str, None] = "c07e9a3d5b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("prompt_tag_pkey", "prompt_tag", schema="specification")
+    # Also drops the id sequence, which the column owns
+    op.drop_column("prompt_tag", "id", schema="specification")
+    # The (prompt_id, tag_id) unique index belongs to its UNIQUE constraint, so it
+    # can't be promoted with USING INDEX; swap the constraints in one statement
+    op.execute("""
+        ALTER TABLE specification.prompt_tag
+        DROP CONSTRAINT prompt_tag_prompt_id_tag_id_key,
+        ADD CONSTRAINT prompt_tag_pkey PRIMARY KEY (prompt_id, tag_id)
+    """)
+    op.create_index(
+        "ix_prompt_tag_tag_id_prompt_id",
+        "prompt_tag",
+        ["tag_id", "prompt_id"],
+        unique=False,
+        schema="specification",
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("Upgrades only")
@@ -2,24 +2,31 @@ from __future__ import annotations
 
 import datetime
 import os
+import uuid
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List, Optional
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Mapped, declared_attr, object_session, relationship
 
 import mc_bench.schema.postgres as schema
+import mc_bench.util.postgres as postgres
 from mc_bench.constants import (
     GENERATION_STATE,
     RUN_STAGE_STATE,
     RUN_STATE,
+    SAMPLE_APPROVAL_STATE,
     STAGE,
 )
+from mc_bench.events.batching import StateChangeBatcher
 from mc_bench.events.types import (
     GenerationStateChanged,
     RunStageStateChanged,
     RunStateChanged,
 )
-from mc_bench.schema.object_store.runs import KINDS, comparison_samples, runs
+from mc_bench.schema.object_store.runs import KINDS
 from mc_bench.util.object_store import (
     get_client,
     get_object_as_bytesio,
@@ -34,7 +41,17 @@ from .user import User
 _run_state_cache: Dict[RUN_STATE, int] = {}
 _generation_state_cache: Dict[RUN_STATE, int] = {}
 _run_stage_state_cache: Dict[RUN_STAGE_STATE, int] = {}
+_sample_approval_state_cache: Dict[SAMPLE_APPROVAL_STATE, int] = {}
 _stage_cache: Dict[STAGE, int] = {}
+_artifact_kind_cache: Dict[str, int] = {}
+_bucket_cache: Dict[str, int] = {}
+
+_SIDE_CAPTURE_KINDS = (
+    ("north", KINDS.NORTHSIDE_CAPTURE_PNG),
+    ("south", KINDS.SOUTHSIDE_CAPTURE_PNG),
+    ("east", KINDS.EASTSIDE_CAPTURE_PNG),
+    ("west", KINDS.WESTSIDE_CAPTURE_PNG),
+)
 
 
 def run_state_id_for(db, state: RUN_STATE):
@@ -54,6 +71,17 @@ def run_stage_state_id_for(db, stage_state: RUN_STAGE_STATE):
     return _run_stage_state_cache[stage_state]
 
 
+def sample_approval_state_id_for(db, state: SAMPLE_APPROVAL_STATE):
+    if state not in _sample_approval_state_cache:
+        _sample_approval_state_cache[state] = db.scalar(
+            select(SampleApprovalState.id).where(
+                SampleApprovalState.name == state.value
+            )
+        )
+
+    return _sample_approval_state_cache[state]
+
+
 def stage_id_for(db, stage: STAGE):
     if stage not in _stage_cache:
         _stage_cache[stage] = db.scalar(
@@ -70,6 +98,44 @@ def generation_state_id_for(db, state: GENERATION_STATE):
     return _generation_state_cache[state]
 
 
+def artifact_kind_id_for(db, name: str):
+    if name not in _artifact_kind_cache:
+        # Artifact kinds are a small, static set; load them all at once
+        _artifact_kind_cache.update(
+            db.execute(select(ArtifactKind.name, ArtifactKind.id)).tuples()
+        )
+    return _artifact_kind_cache.get(name)
+
+
+def artifact_kind_for(db, name: str):
+    artifact_kind_id = artifact_kind_id_for(db, name)
+    if artifact_kind_id is None:
+        return None
+    # Session.get consults the identity map before issuing a primary key lookup
+    return db.get(ArtifactKind, artifact_kind_id)
+
+
+def bucket_id_for(db, name: str) -> int:
+    if name in _bucket_cache:
+        return _bucket_cache[name]
+
+    bucket_id = db.scalar(select(Bucket.id).where(Bucket.name == name))
+    if bucket_id is not None:
+        _bucket_cache[name] = bucket_id
+        return bucket_id
+
+    # Buckets come from deployment config, so register new ones on first use. The
+    # new id isn't cached since this transaction could still roll back.
+    db.execute(
+        pg_insert(schema.sample.bucket).values(name=name).on_conflict_do_nothing()
+    )
+    return db.scalar(select(Bucket.id).where(Bucket.name == name))
+
+
+def bucket_for(db, name: str) -> "Bucket":
+    return db.get(Bucket, bucket_id_for(db, name))
+
+
 class Run(Base):
     __table__ = schema.specification.run
 
@@ -192,10 +258,10 @@ class Run(Base):
             ret["samples"] = [sample.to_dict() for sample in self.samples]
 
         if include_artifacts:
-            ret["artifacts"] = [artifact.to_dict() for artifact in self.artifacts]
+            ret["artifacts"] = [artifact.to_record() for artifact in self.artifacts]
 
         if include_stages:
-            ret["stages"] = [stage.to_dict(redis=redis) for stage in self.stages]
+            ret["stages"] = [stage.to_dict(db=db, redis=redis) for stage in self.stages]
 
         return ret
 
@@ -246,17 +312,16 @@ class Run(Base):
             ),
         ]
 
+    @cached_property
+    def stages_by_slug(self) -> Dict[str, "RunStage"]:
+        # Built once per instance; a run's stages are created alongside the run
+        return {run_stage.stage.slug: run_stage for run_stage in self.stages}
+
     def get_stage(self, name):
-        for stage in self.stages:
-            if stage.stage.slug == name:
-                return name
+        return self.stages_by_slug.get(name)
 
     @classmethod
     def state_change_handler(cls, event: RunStateChanged):
-        from sqlalchemy import func
-
-        import mc_bench.util.postgres as postgres
-
         table = cls.__table__
 
         with postgres.managed_session() as db:
@@ -272,12 +337,20 @@ class Run(Base):
             )
 
     def generate_correlation_id(self) -> str:
-        template_id = self.template.id
-        prompt_id = self.prompt.id
+        # Read the foreign key columns directly so the template and prompt
+        # relationships are not loaded just to get at their ids
+        template_id = self.template_id
+        prompt_id = self.prompt_id
         assert template_id is not None
         assert prompt_id is not None
 
-        return uuid_from_ints(template_id, prompt_id)
+        cache_key = (template_id, prompt_id)
+        cached = self.__dict__.get("_correlation_id")
+        if cached is None or cached[0] != cache_key:
+            cached = (cache_key, uuid_from_ints(template_id, prompt_id))
+            self.__dict__["_correlation_id"] = cached
+
+        return cached[1]
 
 
 class SampleApprovalState(Base):
@@ -352,7 +425,7 @@ class Sample(Base):
             ret["logs"] = [log.to_dict() for log in self.logs]
 
         if include_artifacts:
-            ret["artifacts"] = [artifact.to_dict() for artifact in self.artifacts]
+            ret["artifacts"] = [artifact.to_record() for artifact in self.artifacts]
 
         if self.last_modified is not None:
             ret["last_modified"] = self.last_modified
@@ -370,50 +443,31 @@ class Sample(Base):
 
         return ret
 
+    def _get_artifact_of_kind(self, kind_name):
+        kind_id = artifact_kind_id_for(object_session(self), kind_name)
+        return next(
+            (
+                artifact
+                for artifact in self.artifacts
+                if artifact.artifact_kind_id == kind_id
+            ),
+            None,
+        )
+
     def get_command_list_artifact(self):
-        command_lists = [
-            artifact
-            for artifact in self.artifacts
-            if artifact.kind.name == KINDS.BUILD_COMMAND_LIST
-        ]
-        if command_lists:
-            return command_lists[0]
+        return self._get_artifact_of_kind(KINDS.BUILD_COMMAND_LIST)
 
     def get_build_summary_artifact(self):
-        summaries = [
-            artifact
-            for artifact in self.artifacts
-            if artifact.kind.name == KINDS.BUILD_SUMMARY
-        ]
-        if summaries:
-            return summaries[0]
+        return self._get_artifact_of_kind(KINDS.BUILD_SUMMARY)
 
     def get_schematic_artifact(self):
-        schematics = [
-            artifact
-            for artifact in self.artifacts
-            if artifact.kind.name == KINDS.BUILD_SCHEMATIC
-        ]
-        if schematics:
-            return schematics[0]
+        return self._get_artifact_of_kind(KINDS.BUILD_SCHEMATIC)
 
     def get_render_artifact(self) -> Optional["Artifact"]:
-        renders = [
-            artifact
-            for artifact in self.artifacts
-            if artifact.kind.name == KINDS.RENDERED_MODEL_GLB
-        ]
-        if renders:
-            return renders[0]
+        return self._get_artifact_of_kind(KINDS.RENDERED_MODEL_GLB)
 
     def get_comparison_artifact(self):
-        comparisons = [
-            artifact
-            for artifact in self.artifacts
-            if artifact.kind.name == KINDS.RENDERED_MODEL_GLB_COMPARISON_SAMPLE
-        ]
-        if comparisons:
-            return comparisons[0]
+        return self._get_artifact_of_kind(KINDS.RENDERED_MODEL_GLB_COMPARISON_SAMPLE)
 
     def build_artifact_spec(self, db, structure_name):
         run_external_id = self.run.external_id
@@ -426,17 +480,8 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(
-                        ArtifactKind.name == "ORIGINAL_BUILD_SCRIPT_JS"
-                    )
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    KINDS.ORIGINAL_BUILD_SCRIPT_JS,
-                ),
+                "artifact_kind": artifact_kind_for(db, KINDS.ORIGINAL_BUILD_SCRIPT_JS),
+                "object_kind": KINDS.ORIGINAL_BUILD_SCRIPT_JS,
             },
             "schematic": {
                 "container_path": os.path.join(
@@ -449,15 +494,8 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(ArtifactKind.name == "BUILD_SCHEMATIC")
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    KINDS.BUILD_SCHEMATIC,
-                ),
+                "artifact_kind": artifact_kind_for(db, KINDS.BUILD_SCHEMATIC),
+                "object_kind": KINDS.BUILD_SCHEMATIC,
             },
             "command_list": {
                 "container_path": "/data/commandList.json",
@@ -468,17 +506,8 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(
-                        ArtifactKind.name == "BUILD_COMMAND_LIST"
-                    )
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    KINDS.BUILD_COMMAND_LIST,
-                ),
+                "artifact_kind": artifact_kind_for(db, KINDS.BUILD_COMMAND_LIST),
+                "object_kind": KINDS.BUILD_COMMAND_LIST,
             },
             "build_summary": {
                 "container_path": "/data/summary.json",
@@ -489,15 +518,8 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(ArtifactKind.name == "BUILD_SUMMARY")
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    KINDS.BUILD_SUMMARY,
-                ),
+                "artifact_kind": artifact_kind_for(db, KINDS.BUILD_SUMMARY),
+                "object_kind": KINDS.BUILD_SUMMARY,
             },
         }
 
@@ -512,17 +534,10 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(
-                        ArtifactKind.name == KINDS.COMMAND_LIST_BUILD_SCRIPT_JS
-                    )
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    KINDS.COMMAND_LIST_BUILD_SCRIPT_JS,
+                "artifact_kind": artifact_kind_for(
+                    db, KINDS.COMMAND_LIST_BUILD_SCRIPT_JS
                 ),
+                "object_kind": KINDS.COMMAND_LIST_BUILD_SCRIPT_JS,
             },
             "timelapse": {
                 "container_path": f"/data/processed/{structure_name}_timelapse.mp4",
@@ -533,21 +548,12 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(
-                        ArtifactKind.name == KINDS.BUILD_CINEMATIC_MP4
-                    )
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    KINDS.BUILD_CINEMATIC_MP4,
-                ),
+                "artifact_kind": artifact_kind_for(db, KINDS.BUILD_CINEMATIC_MP4),
+                "object_kind": KINDS.BUILD_CINEMATIC_MP4,
             },
         }
 
-        for side in ["north", "south", "east", "west"]:
+        for side, kind_name in _SIDE_CAPTURE_KINDS:
             spec[f"{side}side_capture"] = {
                 "container_path": f"/data/{side}side_capture.png",
                 "host_file": f"{side}side_capture.png",
@@ -557,18 +563,8 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(
-                        ArtifactKind.name
-                        == getattr(KINDS, f"{side.upper()}SIDE_CAPTURE_PNG")
-                    )
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    getattr(KINDS, f"{side.upper()}SIDE_CAPTURE_PNG"),
-                ),
+                "artifact_kind": artifact_kind_for(db, kind_name),
+                "object_kind": kind_name,
             }
 
         return spec
@@ -584,17 +580,8 @@ class Sample(Base):
                     "sample_id": sample_external_id,
                     "name": f'{self.run.external_id}_{self.external_id}_{datetime.datetime.now().isoformat().replace(":", "_")}',
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(
-                        ArtifactKind.name == KINDS.RENDERED_MODEL_GLB
-                    )
-                ),
-                "object_prototype": runs.get(
-                    KINDS.RUN,
-                    KINDS.SAMPLE,
-                    KINDS.ARTIFACTS,
-                    KINDS.RENDERED_MODEL_GLB,
-                ),
+                "artifact_kind": artifact_kind_for(db, KINDS.RENDERED_MODEL_GLB),
+                "object_kind": KINDS.RENDERED_MODEL_GLB,
             },
         }
 
@@ -608,24 +595,36 @@ class Sample(Base):
                 "object_parts": {
                     "sample_id": comparison_sample_id,
                 },
-                "artifact_kind": db.scalar(
-                    select(ArtifactKind).where(
-                        ArtifactKind.name == KINDS.RENDERED_MODEL_GLB_COMPARISON_SAMPLE
-                    )
-                ),
-                "object_prototype": comparison_samples.get(
-                    KINDS.RENDERED_MODEL_GLB_COMPARISON_SAMPLE,
+                "artifact_kind": artifact_kind_for(
+                    db, KINDS.RENDERED_MODEL_GLB_COMPARISON_SAMPLE
                 ),
+                "object_kind": KINDS.RENDERED_MODEL_GLB_COMPARISON_SAMPLE,
             },
         }
 
         return spec
 
 
+@dataclass(frozen=True, slots=True)
+class ArtifactRecord:
+    """
+    Read-only artifact summary for API responses. Runs and samples can carry many
+    artifacts, so these are built instead of a dict per artifact; the response
+    models read them via `from_attributes`.
+    """
+
+    id: uuid.UUID
+    kind: str
+    created: Optional[datetime.datetime]
+    bucket: str
+    key: str
+
+
 class Artifact(Base):
     __table__ = schema.sample.artifact
 
     kind: Mapped["ArtifactKind"] = relationship("ArtifactKind")
+    bucket: Mapped["Bucket"] = relationship("Bucket")
     run: Mapped["Run"] = relationship("Run", back_populates="artifacts")
     sample: Mapped["Sample"] = relationship(
         "Sample", uselist=False, back_populates="artifacts"
@@ -636,17 +635,26 @@ class Artifact(Base):
             "id": self.external_id,
             "kind": self.kind.name,
             "created": self.created,
-            "bucket": self.bucket,
+            "bucket": self.bucket.name,
             "key": self.key,
         }
 
+    def to_record(self) -> ArtifactRecord:
+        return ArtifactRecord(
+            id=self.external_id,
+            kind=self.kind.name,
+            created=self.created,
+            bucket=self.bucket.name,
+            key=self.key,
+        )
+
     def download_artifact(self, client=None):
         if client is None:
             client = get_client()
 
         return get_object_as_bytesio(
             client=client,
-            bucket_name=self.bucket,
+            bucket_name=self.bucket.name,
             object_name=self.key,
         )
 
@@ -655,7 +663,7 @@ class Artifact(Base):
             client = get_client()
 
         return client.fget_object(
-            bucket_name=self.bucket,
+            bucket_name=self.bucket.name,
             object_name=self.key,
             file_path=filepath,
         )
@@ -665,7 +673,7 @@ class Artifact(Base):
             client = get_client()
 
         return client.fput_object(
-            bucket_name=self.bucket,
+            bucket_name=self.bucket.name,
             object_name=self.key,
             file_path=filepath,
         )
@@ -675,6 +683,10 @@ class ArtifactKind(Base):
     __table__ = schema.sample.artifact_kind
 
 
+class Bucket(Base):
+    __table__ = schema.sample.bucket
+
+
 class Generation(Base):
     __table__ = schema.specification.generation
 
@@ -683,7 +695,7 @@ class Generation(Base):
     )
 
     runs: Mapped[List["Run"]] = relationship(  # noqa: F821
-        "Run", uselist=True, back_populates="generation"
+        "Run", uselist=True, back_populates="generation", order_by="Run.created"
     )
 
     state: Mapped["GenerationState"] = relationship("GenerationState")
@@ -703,14 +715,26 @@ class Generation(Base):
         session = object_session(self)
         return session.scalar(self._run_count_expression)
 
-    def to_dict(self, include_runs=False, include_stats=False):
+    @classmethod
+    def bulk_run_counts(cls, db, ids) -> Dict[int, int]:
+        # Generations without any runs are absent from the result
+        run = schema.specification.run
+        return dict(
+            db.execute(
+                select(run.c.generation_id, func.count(1))
+                .where(run.c.generation_id.in_(ids))
+                .group_by(run.c.generation_id)
+            ).tuples()
+        )
+
+    def to_dict(self, include_runs=False, include_stats=False, run_count=None):
         result = {
             "id": self.external_id,
             "created": self.created,
             "created_by": self.creator.username,
             "name": self.name,
             "description": self.description,
-            "run_count": self.run_count,
+            "run_count": self.run_count if run_count is None else run_count,
             "status": self.state.slug,
             "default_test_set": self.default_test_set.to_dict()
             if self.default_test_set
@@ -718,9 +742,8 @@ class Generation(Base):
         }
 
         if include_runs:
-            result["runs"] = [
-                run.to_dict() for run in sorted(self.runs, key=lambda x: x.created)
-            ]
+            # Generation.runs is ordered by created in SQL
+            result["runs"] = [run.to_dict() for run in self.runs]
 
         if include_stats:
             # TODO: Implement this logic once run state changes are active
@@ -732,8 +755,6 @@ class Generation(Base):
 
     @classmethod
     def state_change_handler(cls, event: GenerationStateChanged):
-        import mc_bench.util.postgres as postgres
-
         table = cls.__table__
 
         with postgres.managed_session() as db:
@@ -780,7 +801,8 @@ class RunStage(Base):
         return {"polymorphic_identity": cls.SLUG}
 
     def to_dict(self, db=None, redis=None):
-        db = object_session(self)
+        if db is None:
+            db = object_session(self)
         state = self.state
         progress_note = None
         if state.id in (
@@ -826,8 +848,6 @@ class RunStage(Base):
         if db is None:
             db = object_session(self)
             if db is None:
-                import mc_bench.util.postgres as postgres
-
                 with postgres.managed_session() as new_db:
                     self._update_heartbeat_in_db(new_db)
                 return
@@ -837,8 +857,6 @@ class RunStage(Base):
     def _update_heartbeat_in_db(self, db):
         """Internal method to update the heartbeat in the database.
         Uses the database server clock to set the timestamp to avoid clock mismatches."""
-        from sqlalchemy import func
-
         # The RunStage table uses timestamp without timezone (timezone=False)
         # So we need to ensure we're consistent with that
         db.execute(
@@ -860,8 +878,6 @@ class RunStage(Base):
         if db is None:
             db = object_session(self)
             if db is None:
-                import mc_bench.util.postgres as postgres
-
                 with postgres.managed_session() as new_db:
                     self._register_task_id_in_db(new_db, task_id)
                 return
@@ -870,8 +886,6 @@ class RunStage(Base):
 
     def _register_task_id_in_db(self, db, task_id):
         """Internal method to register the task ID in the database."""
-        from sqlalchemy import func
-
         db.execute(
             self.__table__.update()
             .where(self.__table__.c.id == self.id)
@@ -880,15 +894,38 @@ class RunStage(Base):
         db.commit()
         self.task_id = task_id
 
+    # Set by subclasses: the celery task to dispatch and the queue it runs on
+    TASK_NAME = None
+    QUEUE = None
+    # Whether the task receives the id of the run's latest sample
+    PASS_SAMPLE_ID = True
+
     def get_task_signature(self, app, progress_token, pass_args=True):
-        pass
+        if self.TASK_NAME is None:
+            return None
+
+        kwargs = {
+            "queue": self.QUEUE,
+            "headers": {
+                "token": progress_token,
+                "enqueued_timestamp": datetime.datetime.now(
+                    tz=datetime.timezone.utc
+                ).isoformat(),
+            },
+        }
+        if pass_args:
+            run = self.run
+            kwargs["args"] = [
+                {
+                    "run_id": run.id,
+                    "sample_id": run.samples[-1].id if self.PASS_SAMPLE_ID else None,
+                }
+            ]
+
+        return app.signature(self.TASK_NAME, **kwargs)
 
     @classmethod
     def state_change_handler(cls, event: RunStageStateChanged):
-        from sqlalchemy import func
-
-        import mc_bench.util.postgres as postgres
-
         table = cls.__table__
 
         with postgres.managed_session() as db:
@@ -906,198 +943,88 @@ class RunStage(Base):
 
 class PromptExecution(RunStage):
     SLUG = "PROMPT_EXECUTION"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "prompt"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": None,
-                }
-            ]
-
-        return app.signature("run.execute_prompt", **kwargs)
+    TASK_NAME = "run.execute_prompt"
+    QUEUE = "prompt"
+    PASS_SAMPLE_ID = False
 
 
 class ResponseParsing(RunStage):
     SLUG = "RESPONSE_PARSING"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "parse"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            sample_id = self.run.samples[-1].id
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": sample_id,
-                }
-            ]
-
-        return app.signature("run.parse_prompt", **kwargs)
+    TASK_NAME = "run.parse_prompt"
+    QUEUE = "parse"
 
 
 class CodeValidation(RunStage):
     SLUG = "CODE_VALIDATION"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "validate"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            sample_id = self.run.samples[-1].id
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": sample_id,
-                }
-            ]
-
-        return app.signature("run.code_validation", **kwargs)
+    TASK_NAME = "run.code_validation"
+    QUEUE = "validate"
 
 
 class Building(RunStage):
     SLUG = "BUILDING"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "server"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            sample_id = self.run.samples[-1].id
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": sample_id,
-                }
-            ]
-
-        return app.signature("run.build_structure", **kwargs)
+    TASK_NAME = "run.build_structure"
+    QUEUE = "server"
 
 
 class ExportingContent(RunStage):
     SLUG = "EXPORTING_CONTENT"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "server"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            sample_id = self.run.samples[-1].id
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": sample_id,
-                }
-            ]
-
-        return app.signature("run.export_structure_views", **kwargs)
+    TASK_NAME = "run.export_structure_views"
+    QUEUE = "server"
 
 
 class PostProcessing(RunStage):
     SLUG = "POST_PROCESSING"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "post_process"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            sample_id = self.run.samples[-1].id
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": sample_id,
-                }
-            ]
-
-        return app.signature("run.post_processing", **kwargs)
+    TASK_NAME = "run.post_processing"
+    QUEUE = "post_process"
 
 
 class PreparingSample(RunStage):
     SLUG = "PREPARING_SAMPLE"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "prepare"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            sample_id = self.run.samples[-1].id
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": sample_id,
-                }
-            ]
-
-        return app.signature("run.prepare_sample", **kwargs)
+    TASK_NAME = "run.prepare_sample"
+    QUEUE = "prepare"
 
 
 class RenderingSample(RunStage):
     SLUG = "RENDERING_SAMPLE"
-
-    def get_task_signature(self, app, progress_token, pass_args=True):
-        kwargs = {}
-        kwargs["queue"] = "render"
-        kwargs["headers"] = {
-            "token": progress_token,
-            "enqueued_timestamp": datetime.datetime.now(
-                tz=datetime.timezone.utc
-            ).isoformat(),
-        }
-        if pass_args:
-            sample_id = self.run.samples[-1].id
-            kwargs["args"] = [
-                {
-                    "run_id": self.run.id,
-                    "sample_id": sample_id,
-                }
-            ]
-
-        return app.signature("run.render_sample", **kwargs)
+    TASK_NAME = "run.render_sample"
+    QUEUE = "render"
+
+
+def make_state_change_batcher(flush_interval: float = 0.05) -> StateChangeBatcher:
+    """
+    Build a StateChangeBatcher covering the same events as the `state_change_handler`
+    classmethods. Register `batcher.handle` for each event type and call `start()`.
+    """
+    batcher = StateChangeBatcher(flush_interval=flush_interval)
+    batcher.register(
+        RunStateChanged,
+        Run.__table__,
+        "run_id",
+        run_state_id_for,
+        touch_last_modified=True,
+    )
+    batcher.register(
+        RunStageStateChanged,
+        RunStage.__table__,
+        "stage_id",
+        run_stage_state_id_for,
+        touch_last_modified=True,
+    )
+    # No last_modified column in generation table
+    batcher.register(
+        GenerationStateChanged,
+        Generation.__table__,
+        "generation_id",
+        generation_state_id_for,
+    )
+    return batcher
 
 
 __all__ = [
     "Artifact",
     "ArtifactKind",
+    "ArtifactRecord",
+    "Bucket",
     "Generation",
     "GenerationState",
     "Run",
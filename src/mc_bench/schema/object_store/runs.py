@@ -1,32 +1,34 @@
+from typing import Final
+
 from mc_bench.util.object_store import Prototype
 
 
 class KINDS:
-    RUN = "RUN"
-    SAMPLE = "SAMPLE"
-    ARTIFACTS = "ARTIFACTS"
-    COMPARISON_SAMPLES = "COMPARISON_SAMPLES"
+    RUN: Final = "RUN"
+    SAMPLE: Final = "SAMPLE"
+    ARTIFACTS: Final = "ARTIFACTS"
+    COMPARISON_SAMPLES: Final = "COMPARISON_SAMPLES"
 
     # leaf nodes
-    NBT_STRUCTURE_FILE = "NBT_STRUCTURE_FILE"
-    PROMPT = "PROMPT"
-    ORIGINAL_BUILD_SCRIPT_JS = "ORIGINAL_BUILD_SCRIPT_JS"
-    ORIGINAL_BUILD_SCRIPT_PY = "ORIGINAL_BUILD_SCRIPT_PY"
-    RAW_RESPONSE = "RAW_RESPONSE"
-    BUILD_SCHEMATIC = "BUILD_SCHEMATIC"
-    BUILD_COMMAND_LIST = "BUILD_COMMAND_LIST"
-    BUILD_SUMMARY = "BUILD_SUMMARY"
-    COMMAND_LIST_BUILD_SCRIPT_JS = "COMMAND_LIST_BUILD_SCRIPT_JS"
-    COMMAND_LIST_BUILD_SCRIPT_PY = "COMMAND_LIST_BUILD_SCRIPT_PY"
-    CONTENT_EXPORT_BUILD_SCRIPT_JS = "CONTENT_EXPORT_BUILD_SCRIPT_JS"
-    CONTENT_EXPORT_BUILD_SCRIPT_PY = "CONTENT_EXPORT_BUILD_SCRIPT_PY"
-    NORTHSIDE_CAPTURE_PNG = "NORTHSIDE_CAPTURE_PNG"
-    EASTSIDE_CAPTURE_PNG = "EASTSIDE_CAPTURE_PNG"
-    SOUTHSIDE_CAPTURE_PNG = "SOUTHSIDE_CAPTURE_PNG"
-    WESTSIDE_CAPTURE_PNG = "WESTSIDE_CAPTURE_PNG"
-    BUILD_CINEMATIC_MP4 = "BUILD_CINEMATIC_MP4"
-    RENDERED_MODEL_GLB = "RENDERED_MODEL_GLB"
-    RENDERED_MODEL_GLB_COMPARISON_SAMPLE = "RENDERED_MODEL_GLB_COMPARISON_SAMPLE"
+    NBT_STRUCTURE_FILE: Final = "NBT_STRUCTURE_FILE"
+    PROMPT: Final = "PROMPT"
+    ORIGINAL_BUILD_SCRIPT_JS: Final = "ORIGINAL_BUILD_SCRIPT_JS"
+    ORIGINAL_BUILD_SCRIPT_PY: Final = "ORIGINAL_BUILD_SCRIPT_PY"
+    RAW_RESPONSE: Final = "RAW_RESPONSE"
+    BUILD_SCHEMATIC: Final = "BUILD_SCHEMATIC"
+    BUILD_COMMAND_LIST: Final = "BUILD_COMMAND_LIST"
+    BUILD_SUMMARY: Final = "BUILD_SUMMARY"
+    COMMAND_LIST_BUILD_SCRIPT_JS: Final = "COMMAND_LIST_BUILD_SCRIPT_JS"
+    COMMAND_LIST_BUILD_SCRIPT_PY: Final = "COMMAND_LIST_BUILD_SCRIPT_PY"
+    CONTENT_EXPORT_BUILD_SCRIPT_JS: Final = "CONTENT_EXPORT_BUILD_SCRIPT_JS"
+    CONTENT_EXPORT_BUILD_SCRIPT_PY: Final = "CONTENT_EXPORT_BUILD_SCRIPT_PY"
+    NORTHSIDE_CAPTURE_PNG: Final = "NORTHSIDE_CAPTURE_PNG"
+    EASTSIDE_CAPTURE_PNG: Final = "EASTSIDE_CAPTURE_PNG"
+    SOUTHSIDE_CAPTURE_PNG: Final = "SOUTHSIDE_CAPTURE_PNG"
+    WESTSIDE_CAPTURE_PNG: Final = "WESTSIDE_CAPTURE_PNG"
+    BUILD_CINEMATIC_MP4: Final = "BUILD_CINEMATIC_MP4"
+    RENDERED_MODEL_GLB: Final = "RENDERED_MODEL_GLB"
+    RENDERED_MODEL_GLB_COMPARISON_SAMPLE: Final = "RENDERED_MODEL_GLB_COMPARISON_SAMPLE"
 
 
 runs = Prototype(
@@ -118,3 +120,19 @@ comparison_samples = Prototype(
         ),
     ],
 )
+
+# Full path patterns by kind, resolved once so that building an object key is a
+# single format call rather than a walk up the prototype tree
+_PATH_BY_KIND = {**runs.flatten(), **comparison_samples.flatten()}
+
+
+def path_for(kind: str, **kwargs) -> str:
+    return _PATH_BY_KIND[kind].format_map(kwargs)
+
+
+__all__ = [
+    "KINDS",
+    "comparison_samples",
+    "path_for",
+    "runs",
+]
@@ -1,5 +1,26 @@
-from . import auth, research, sample, scoring, specification
-from ._metadata import metadata
+import importlib
+
+_SCHEMAS = ("auth", "research", "sample", "scoring", "specification")
+
+
+def __getattr__(name):
+    # Schemas are imported on first use, so processes that never touch the
+    # database don't pay for building every Table
+    if name in _SCHEMAS:
+        return importlib.import_module(f".{name}", __name__)
+
+    if name == "metadata":
+        # Foreign keys and migrations need every table registered on the metadata
+        for schema in _SCHEMAS:
+            importlib.import_module(f".{schema}", __name__)
+
+        from ._metadata import metadata
+
+        globals()["metadata"] = metadata
+        return metadata
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "auth",
@@ -21,6 +21,6 @@ auth_provider = Table(
     Column("created_by", Integer, ForeignKey("auth.user.id"), nullable=False),
     Column("last_modified", TIMESTAMP(timezone=False), nullable=True),
     Column("last_modified_by", Integer, ForeignKey("auth.user.id"), nullable=True),
-    Column("name", String, nullable=False, unique=True),
+    Column("name", String(64), nullable=False, unique=True),
     schema="auth",
 )
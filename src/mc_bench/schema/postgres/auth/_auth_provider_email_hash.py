@@ -3,10 +3,11 @@ from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Table,
-    UniqueConstraint,
     func,
 )
 
@@ -24,8 +25,17 @@ auth_provider_email_hash = Table(
     ),
     Column("auth_provider_user_id", String, nullable=False),
     Column("user_id", Integer, ForeignKey("auth.user.id"), nullable=False),
-    Column("email_hash", String, nullable=False),
-    # We never want to permit a duplicate email hash from the same auth provider
-    UniqueConstraint("auth_provider_id", "email_hash"),
+    Column("email_hash", LargeBinary(32), nullable=False),
+    # We never want to permit a duplicate email hash from the same auth provider.
+    # email_hash leads since logins look hashes up across all providers, and
+    # user_id is included so those lookups don't have to visit the heap.
+    Index(
+        "uq_auth_provider_email_hash",
+        "email_hash",
+        "auth_provider_id",
+        unique=True,
+        postgresql_include=["user_id"],
+    ),
+    Index("ix_auth_provider_email_hash_user_id", "user_id"),
     schema="auth",
 )
@@ -18,7 +18,7 @@ role = Table(
     metadata,
     Column("id", BigInteger, primary_key=True, autoincrement=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
@@ -3,6 +3,7 @@ from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Index,
     Integer,
     Table,
     UniqueConstraint,
@@ -22,5 +23,7 @@ role_permission = Table(
     Column("role_id", Integer, ForeignKey("auth.role.id"), nullable=False),
     Column("permission_id", Integer, ForeignKey("auth.permission.id"), nullable=False),
     UniqueConstraint("role_id", "permission_id"),
+    # role_id lookups are served by the unique constraint
+    Index("ix_role_permission_permission_id", "permission_id"),
     schema="auth",
 )
@@ -23,7 +23,7 @@ user = Table(
     Column("last_modified", TIMESTAMP(timezone=False), nullable=True),
     Column("last_modified_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("username", String(64), nullable=True, unique=True, index=True),
     Column("username_normalized", String(64), nullable=True, unique=True, index=True),
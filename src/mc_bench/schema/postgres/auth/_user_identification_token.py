@@ -5,6 +5,7 @@ from sqlalchemy import (
     UUID,
     Column,
     ForeignKey,
+    Index,
     Integer,
     Table,
     UniqueConstraint,
@@ -18,7 +19,8 @@ user_identification_token = Table(
     "user_identification_token",
     metadata,
     Column("id", Integer, primary_key=True, autoincrement=True),
-    Column("token", UUID, nullable=False, server_default=text("uuid_generate_v4()")),
+    # Random rather than time-ordered: tokens should not reveal when they were issued
+    Column("token", UUID, nullable=False, server_default=text("gen_random_uuid()")),
     Column("user_id", ForeignKey("auth.user.id"), nullable=True),
     Column(
         "created_at",
@@ -32,6 +34,10 @@ user_identification_token = Table(
         server_default=func.now(),
         nullable=False,
     ),
+    # Also serves lookups by token alone, since token is the leading column
     UniqueConstraint("token", "user_id", name="uq_token_user_id"),
+    # For expiry sweeps. last_used_at is bumped on every request, and unlike a
+    # btree a BRIN index still lets those updates be HOT
+    Index("brin_uit_last_used_at", "last_used_at", postgresql_using="brin"),
     schema="auth",
 )
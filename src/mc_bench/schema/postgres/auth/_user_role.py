@@ -3,6 +3,7 @@ from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Index,
     Integer,
     Table,
     UniqueConstraint,
@@ -22,5 +23,7 @@ user_role = Table(
     Column("user_id", Integer, ForeignKey("auth.user.id"), nullable=False),
     Column("role_id", Integer, ForeignKey("auth.role.id"), nullable=False),
     UniqueConstraint("user_id", "role_id"),
+    # user_id lookups are served by the unique constraint
+    Index("ix_user_role_role_id", "role_id"),
     schema="auth",
 )
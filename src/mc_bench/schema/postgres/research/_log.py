@@ -27,7 +27,7 @@ log = Table(
     ),
     Column("created_by", Integer, ForeignKey("auth.user.id"), nullable=False),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column(
         "action_slug", String, ForeignKey("research.log_action.name"), nullable=False
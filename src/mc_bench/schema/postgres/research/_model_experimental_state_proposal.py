@@ -17,7 +17,7 @@ model_experimental_state_proposal = Table(
     metadata,
     Column("id", Integer, primary_key=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
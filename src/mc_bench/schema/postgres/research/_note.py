@@ -29,7 +29,7 @@ note = Table(
     Column("deleted", TIMESTAMP(timezone=False), nullable=True),
     Column("deleted_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("kind_slug", String, ForeignKey("research.note_kind.name"), nullable=False),
     Column("content", String, nullable=False),
@@ -4,6 +4,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    Index,
     Integer,
     Table,
     func,
@@ -17,7 +18,7 @@ template_experimental_state_proposal = Table(
     metadata,
     Column("id", Integer, primary_key=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
@@ -41,5 +42,13 @@ template_experimental_state_proposal = Table(
     Column("rejected_at", TIMESTAMP(timezone=False), nullable=True),
     Column("rejected_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column("rejected_log_id", Integer, ForeignKey("research.log.id"), nullable=True),
+    Index("ix_template_experimental_state_proposal_template_id", "template_id"),
+    Index(
+        "ix_template_experimental_state_proposal_new_experiment_state_id",
+        "new_experiment_state_id",
+    ),
+    Index("ix_template_experimental_state_proposal_log_id", "log_id"),
+    Index("ix_template_experimental_state_proposal_accepted_by", "accepted_by"),
+    Index("ix_template_experimental_state_proposal_rejected_by", "rejected_by"),
     schema="research",
 )
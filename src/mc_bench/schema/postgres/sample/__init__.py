@@ -1,11 +1,13 @@
 from ._artifact import artifact
 from ._artifact_kind import artifact_kind
+from ._bucket import bucket
 from ._sample import sample
 from ._test_set import test_set
 
 __all__ = [
     "artifact",
     "artifact_kind",
+    "bucket",
     "sample",
     "test_set",
 ]
@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Table,
     func,
@@ -40,12 +41,27 @@ artifact = Table(
         ForeignKey("sample.sample.id"),
         nullable=True,
     ),
-    Column("bucket", String, unique=False, nullable=False),
+    Column(
+        "bucket_id",
+        SmallInteger,
+        ForeignKey("sample.bucket.id"),
+        nullable=False,
+    ),
     Column("key", String, unique=False, nullable=False),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     # Add index for (sample_id, artifact_kind_id)
     Index("ix_artifact_sample_id_kind_id", "sample_id", "artifact_kind_id"),
+    # Also serves run_id-only lookups such as Run.artifacts and the run FK
+    Index("ix_artifact_run_id_kind_id", "run_id", "artifact_kind_id"),
+    Index("ix_artifact_artifact_kind_id", "artifact_kind_id"),
+    # Time-window scans over artifact.created (artifacts written in the last N days)
+    Index(
+        "brin_artifact_created",
+        "created",
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 64},
+    ),
     schema="sample",
 )
@@ -0,0 +1,16 @@
+""" """
+
+from sqlalchemy import TIMESTAMP, Column, Identity, SmallInteger, String, Table, func
+
+from .._metadata import metadata
+
+bucket = Table(
+    "bucket",
+    metadata,
+    Column("id", SmallInteger, Identity(), primary_key=True),
+    Column(
+        "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=True
+    ),
+    Column("name", String, unique=True, nullable=False),
+    schema="sample",
+)
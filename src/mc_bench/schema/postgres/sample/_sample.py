@@ -28,13 +28,15 @@ sample = Table(
     Column("last_modified", TIMESTAMP(timezone=False), nullable=True),
     Column("last_modified_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
+    # Random rather than time-ordered: voters see this id, and it must not hint at
+    # which sample is older
     Column(
         "comparison_sample_id",
         UUID,
         nullable=False,
-        server_default=text("uuid_generate_v4()"),
+        server_default=text("gen_random_uuid()"),
     ),
     Column(
         "run_id",
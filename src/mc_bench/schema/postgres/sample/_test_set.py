@@ -23,7 +23,7 @@ test_set = Table(
     ),
     Column("created_by", Integer, ForeignKey("auth.user.id"), nullable=False),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("name", String, unique=True, nullable=False),
     Column("description", String, nullable=False),
@@ -2,6 +2,7 @@ from ._comparison import comparison
 from ._comparison_rank import comparison_rank
 from ._metric import metric
 from ._model_leaderboard import model_leaderboard
+from ._model_leaderboard_view import model_leaderboard_view
 from ._processed_comparison import processed_comparison
 from ._prompt_leaderboard import prompt_leaderboard
 from ._sample_approval_state import sample_approval_state
@@ -12,6 +13,7 @@ __all__ = [
     "comparison_rank",
     "metric",
     "model_leaderboard",
+    "model_leaderboard_view",
     "processed_comparison",
     "prompt_leaderboard",
     "sample_approval_state",
@@ -23,7 +23,7 @@ comparison = Table(
     ),
     Column("user_id", ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "comparison_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "comparison_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("metric_id", Integer, ForeignKey("scoring.metric.id"), nullable=False),
     Column("test_set_id", Integer, ForeignKey("sample.test_set.id"), nullable=False),
@@ -36,6 +36,28 @@ comparison = Table(
     ),
     # Add indexes for comparison table
     Index("ix_comparison_comparison_id", "comparison_id"),
+    # Also serves metric_id-only filters (and the metric FK), so metric_id doesn't
+    # need an index of its own
     Index("ix_comparison_metric_test_set", "metric_id", "test_set_id"),
+    # Every comparison has either a user_id or an identification_token_id, so
+    # only index the rows where each one is set
+    Index(
+        "ix_comparison_user_id_nn",
+        "user_id",
+        postgresql_where=text("user_id IS NOT NULL"),
+    ),
+    Index(
+        "ix_comparison_token_id_nn",
+        "identification_token_id",
+        postgresql_where=text("identification_token_id IS NOT NULL"),
+    ),
+    Index("ix_comparison_session_id", "session_id"),
+    # Recent-vote queries, e.g. a metric's comparisons from the last N days
+    Index(
+        "brin_comparison_created",
+        "created",
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 64},
+    ),
     schema="scoring",
 )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Identity,
     Integer,
     String,
     Table,
@@ -18,7 +19,7 @@ from .._metadata import metadata
 metric = Table(
     "metric",
     metadata,
-    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("id", BigInteger, Identity(), primary_key=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
     ),
@@ -26,7 +27,7 @@ metric = Table(
     Column("last_modified", TIMESTAMP(timezone=False), nullable=True),
     Column("last_modified_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("name", String(), unique=True, nullable=False),
     Column("description", String(), nullable=False),
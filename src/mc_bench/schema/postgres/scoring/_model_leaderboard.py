@@ -8,11 +8,13 @@ from sqlalchemy import (
     Column,
     Float,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Table,
     UniqueConstraint,
     func,
+    text,
 )
 
 from .._metadata import metadata
@@ -20,7 +22,7 @@ from .._metadata import metadata
 model_leaderboard = Table(
     "model_leaderboard",
     metadata,
-    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("id", Integer, Identity(), primary_key=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
     ),
@@ -31,10 +33,30 @@ model_leaderboard = Table(
         onupdate=func.now(),
         nullable=False,
     ),
-    Column("model_id", Integer, ForeignKey("specification.model.id"), nullable=False),
-    Column("metric_id", Integer, ForeignKey("scoring.metric.id"), nullable=False),
-    Column("test_set_id", Integer, ForeignKey("sample.test_set.id"), nullable=False),
-    Column("tag_id", Integer, ForeignKey("specification.tag.id"), nullable=True),
+    Column(
+        "model_id",
+        Integer,
+        ForeignKey("specification.model.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "metric_id",
+        Integer,
+        ForeignKey("scoring.metric.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "test_set_id",
+        Integer,
+        ForeignKey("sample.test_set.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "tag_id",
+        Integer,
+        ForeignKey("specification.tag.id", ondelete="CASCADE"),
+        nullable=True,
+    ),
     Column("elo_score", Float, nullable=False, default=1000.0),
     Column("vote_count", Integer, nullable=False, default=0),
     Column("win_count", Integer, nullable=False, default=0),
@@ -49,13 +71,25 @@ model_leaderboard = Table(
         name="unique_model_leaderboard_entry",
     ),
     # Add indexes for leaderboard queries
-    Index("ix_model_leaderboard_elo_score", "elo_score"),
+    # Matches the leaderboard query (filter on metric/test set/tag, ORDER BY
+    # elo_score DESC LIMIT n) so it can read the top rows off the index instead of
+    # sorting. vote_count is included for the minimum vote filter.
     Index(
-        "ix_model_leaderboard_metric_test_set_tag_vote",
+        "ix_model_leaderboard_metric_test_set_tag_elo",
         "metric_id",
         "test_set_id",
         "tag_id",
-        "vote_count",
+        text("elo_score DESC"),
+        postgresql_include=["vote_count"],
+    ),
+    # Backs the tag_id foreign key, so deleting a tag doesn't scan the table for
+    # rows to cascade to. Untagged rows never need it.
+    Index(
+        "ix_model_leaderboard_tag_id",
+        "tag_id",
+        postgresql_where=text("tag_id IS NOT NULL"),
     ),
+    # Backs the test_set_id foreign key, so deleting a test set doesn't scan the table
+    Index("ix_model_leaderboard_test_set_id", "test_set_id"),
     schema="scoring",
 )
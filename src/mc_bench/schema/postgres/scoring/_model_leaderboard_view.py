@@ -0,0 +1,43 @@
+"""
+Materialized view of model_leaderboard joined with the model and tag display columns,
+with deprecated models left out. Serves /api/leaderboard.
+
+This is not a table: it is created and refreshed with raw DDL (see the elo_calculation
+task) and is skipped by alembic autogenerate via info["is_view"].
+"""
+
+from sqlalchemy import (
+    TIMESTAMP,
+    UUID,
+    BigInteger,
+    Column,
+    Float,
+    Integer,
+    String,
+    Table,
+)
+
+from .._metadata import metadata
+
+model_leaderboard_view = Table(
+    "model_leaderboard_view",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("model_id", BigInteger, nullable=False),
+    Column("metric_id", Integer, nullable=False),
+    Column("test_set_id", Integer, nullable=False),
+    Column("tag_id", Integer, nullable=True),
+    Column("elo_score", Float, nullable=False),
+    Column("vote_count", Integer, nullable=False),
+    Column("win_count", Integer, nullable=False),
+    Column("loss_count", Integer, nullable=False),
+    Column("tie_count", Integer, nullable=False),
+    Column("last_updated", TIMESTAMP(timezone=False), nullable=False),
+    Column("model_external_id", UUID, nullable=False),
+    Column("model_name", String, nullable=False),
+    Column("model_slug", String, nullable=False),
+    Column("tag_external_id", UUID, nullable=True),
+    Column("tag_name", String(64), nullable=True),
+    info={"is_view": True},
+    schema="scoring",
+)
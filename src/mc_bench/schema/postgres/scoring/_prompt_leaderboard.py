@@ -8,11 +8,13 @@ from sqlalchemy import (
     Column,
     Float,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Table,
     UniqueConstraint,
     func,
+    text,
 )
 
 from .._metadata import metadata
@@ -20,7 +22,7 @@ from .._metadata import metadata
 prompt_leaderboard = Table(
     "prompt_leaderboard",
     metadata,
-    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("id", Integer, Identity(), primary_key=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
     ),
@@ -31,11 +33,36 @@ prompt_leaderboard = Table(
         onupdate=func.now(),
         nullable=False,
     ),
-    Column("prompt_id", Integer, ForeignKey("specification.prompt.id"), nullable=False),
-    Column("model_id", Integer, ForeignKey("specification.model.id"), nullable=False),
-    Column("metric_id", Integer, ForeignKey("scoring.metric.id"), nullable=False),
-    Column("test_set_id", Integer, ForeignKey("sample.test_set.id"), nullable=False),
-    Column("tag_id", Integer, ForeignKey("specification.tag.id"), nullable=True),
+    Column(
+        "prompt_id",
+        Integer,
+        ForeignKey("specification.prompt.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "model_id",
+        Integer,
+        ForeignKey("specification.model.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "metric_id",
+        Integer,
+        ForeignKey("scoring.metric.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "test_set_id",
+        Integer,
+        ForeignKey("sample.test_set.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "tag_id",
+        Integer,
+        ForeignKey("specification.tag.id", ondelete="CASCADE"),
+        nullable=True,
+    ),
     Column("elo_score", Float, nullable=False, default=1000.0),
     Column("vote_count", Integer, nullable=False, default=0),
     Column("win_count", Integer, nullable=False, default=0),
@@ -51,7 +78,6 @@ prompt_leaderboard = Table(
         name="unique_prompt_leaderboard_entry",
     ),
     # Add indexes for leaderboard queries
-    Index("ix_prompt_leaderboard_elo_score", "elo_score"),
     Index(
         "ix_prompt_leaderboard_metric_test_set_tag_vote",
         "metric_id",
@@ -59,5 +85,21 @@ prompt_leaderboard = Table(
         "tag_id",
         "vote_count",
     ),
+    # Per model prompt leaderboard lookups; also backs the model_id foreign key
+    Index(
+        "ix_prompt_leaderboard_model_metric_test_set_tag",
+        "model_id",
+        "metric_id",
+        "test_set_id",
+        "tag_id",
+    ),
+    # Backs the tag_id foreign key. Untagged rows never need it.
+    Index(
+        "ix_prompt_leaderboard_tag_id",
+        "tag_id",
+        postgresql_where=text("tag_id IS NOT NULL"),
+    ),
+    # Backs the test_set_id foreign key, so deleting a test set doesn't scan the table
+    Index("ix_prompt_leaderboard_test_set_id", "test_set_id"),
     schema="scoring",
 )
@@ -8,11 +8,13 @@ from sqlalchemy import (
     Column,
     Float,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Table,
     UniqueConstraint,
     func,
+    text,
 )
 
 from .._metadata import metadata
@@ -20,7 +22,7 @@ from .._metadata import metadata
 sample_leaderboard = Table(
     "sample_leaderboard",
     metadata,
-    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("id", Integer, Identity(), primary_key=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
     ),
@@ -31,9 +33,24 @@ sample_leaderboard = Table(
         onupdate=func.now(),
         nullable=False,
     ),
-    Column("sample_id", Integer, ForeignKey("sample.sample.id"), nullable=False),
-    Column("metric_id", Integer, ForeignKey("scoring.metric.id"), nullable=False),
-    Column("test_set_id", Integer, ForeignKey("sample.test_set.id"), nullable=False),
+    Column(
+        "sample_id",
+        Integer,
+        ForeignKey("sample.sample.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "metric_id",
+        Integer,
+        ForeignKey("scoring.metric.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "test_set_id",
+        Integer,
+        ForeignKey("sample.test_set.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
     Column("elo_score", Float, nullable=False, default=1000.0),
     Column("vote_count", Integer, nullable=False, default=0),
     Column("win_count", Integer, nullable=False, default=0),
@@ -44,7 +61,14 @@ sample_leaderboard = Table(
         "sample_id", "metric_id", "test_set_id", name="unique_sample_leaderboard_entry"
     ),
     # Add indexes for leaderboard queries
-    Index("ix_sample_leaderboard_elo_score", "elo_score"),
-    Index("ix_sample_leaderboard_metric_test_set", "metric_id", "test_set_id"),
+    # Lets per-metric/test set queries ordered by elo_score DESC skip the sort
+    Index(
+        "ix_sample_leaderboard_metric_test_set_elo",
+        "metric_id",
+        "test_set_id",
+        text("elo_score DESC"),
+    ),
+    # Backs the test_set_id foreign key, so deleting a test set doesn't scan the table
+    Index("ix_sample_leaderboard_test_set_id", "test_set_id"),
     schema="scoring",
 )
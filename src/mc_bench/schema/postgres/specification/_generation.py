@@ -6,6 +6,7 @@ from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Identity,
     Integer,
     String,
     Table,
@@ -18,13 +19,13 @@ from .._metadata import metadata
 generation = Table(
     "generation",
     metadata,
-    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("id", BigInteger, Identity(), primary_key=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=True
     ),
     Column("created_by", Integer, ForeignKey("auth.user.id"), nullable=False),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("name", String, nullable=False),
     Column("description", String, nullable=False),
@@ -1,11 +1,11 @@
 from sqlalchemy import (
     TIMESTAMP,
-    BigInteger,
     Column,
     ForeignKey,
+    Index,
     Integer,
+    PrimaryKeyConstraint,
     Table,
-    UniqueConstraint,
     func,
 )
 
@@ -14,13 +14,15 @@ from .._metadata import metadata
 prompt_tag = Table(
     "prompt_tag",
     metadata,
-    Column("id", BigInteger, primary_key=True, autoincrement=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
     ),
     Column("created_by", Integer, ForeignKey("auth.user.id"), nullable=False),
     Column("prompt_id", Integer, ForeignKey("specification.prompt.id"), nullable=False),
     Column("tag_id", Integer, ForeignKey("specification.tag.id"), nullable=False),
-    UniqueConstraint("prompt_id", "tag_id"),
+    # A pure association table, so the pair is the key rather than a surrogate id
+    PrimaryKeyConstraint("prompt_id", "tag_id", name="prompt_tag_pkey"),
+    # For "which prompts have this tag" lookups (tag filters on the leaderboards)
+    Index("ix_prompt_tag_tag_id_prompt_id", "tag_id", "prompt_id"),
     schema="specification",
 )
@@ -1,24 +1,25 @@
 from sqlalchemy import (
-    JSON,
     TIMESTAMP,
     UUID,
     BigInteger,
     Boolean,
     Column,
     ForeignKey,
+    Identity,
     Integer,
     String,
     Table,
     func,
     text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 
 from .._metadata import metadata
 
 provider = Table(
     "provider",
     metadata,
-    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("id", BigInteger, Identity(), primary_key=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
     ),
@@ -26,7 +27,7 @@ provider = Table(
     Column("last_modified", TIMESTAMP(timezone=False), nullable=True),
     Column("last_modified_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column(
         "model_id",
@@ -45,7 +46,7 @@ provider = Table(
         ForeignKey("specification.provider_class.name"),
         nullable=False,
     ),
-    Column("config", JSON, nullable=False),
+    Column("config", JSONB, nullable=False),
     Column("is_default", Boolean, nullable=True),
     schema="specification",
 )
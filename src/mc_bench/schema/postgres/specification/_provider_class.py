@@ -1,23 +1,24 @@
 from sqlalchemy import (
-    JSON,
     TIMESTAMP,
     UUID,
     BigInteger,
     Column,
     ForeignKey,
+    Identity,
     Integer,
     String,
     Table,
     func,
     text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 
 from .._metadata import metadata
 
 provider_class = Table(
     "provider_class",
     metadata,
-    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("id", BigInteger, Identity(), primary_key=True),
     Column(
         "created", TIMESTAMP(timezone=False), server_default=func.now(), nullable=False
     ),
@@ -25,9 +26,9 @@ provider_class = Table(
     Column("last_modified", TIMESTAMP(timezone=False), nullable=True),
     Column("last_modified_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("name", String, unique=True, nullable=False),
-    Column("default_config", JSON, nullable=False, server_default=text("'{}'::jsonb")),
+    Column("default_config", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
     schema="specification",
 )
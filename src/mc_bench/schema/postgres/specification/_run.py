@@ -26,7 +26,7 @@ run = Table(
     Column("last_modified", TIMESTAMP(timezone=False), nullable=True),
     Column("last_modified_by", Integer, ForeignKey("auth.user.id"), nullable=True),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("template_id", Integer, ForeignKey("specification.template.id")),
     Column("prompt_id", Integer, ForeignKey("specification.prompt.id")),
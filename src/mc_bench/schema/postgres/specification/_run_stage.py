@@ -30,7 +30,7 @@ run_stage = Table(
         nullable=True,
     ),
     Column(
-        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v4()")
+        "external_id", UUID, nullable=False, server_default=text("uuid_generate_v7()")
     ),
     Column("run_id", Integer, ForeignKey("specification.run.id"), nullable=False),
     Column("stage_id", Integer, ForeignKey("specification.stage.id"), nullable=False),
@@ -1,4 +1,4 @@
-from sqlalchemy import TIMESTAMP, Column, Index, String, Table, func
+from sqlalchemy import TIMESTAMP, Column, Index, String, Table, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from mc_bench.schema.postgres._metadata import metadata
@@ -10,7 +10,7 @@ scheduler_control = Table(
         "id",
         UUID(as_uuid=True),
         primary_key=True,
-        server_default="uuid_generate_v4()",
+        server_default=text("gen_random_uuid()"),
         comment="Primary key for the scheduler control value",
     ),
     Column(
@@ -1,10 +1,14 @@
+import copy
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
+import jwt
 from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt import ExpiredSignatureError, InvalidTokenError
 from sqlalchemy.orm import Session
 
 from mc_bench.models.user import User, UserIdentificationToken
@@ -17,6 +21,39 @@ SESSION_HEADER = "X-MCBench-Session"
 IDENTIFICATION_HEADER = "X-MCBench-Identification"
 
 
+@lru_cache(maxsize=4096)
+def _verify(token: str, secret: str, algorithm: str) -> dict:
+    return jwt.decode(token, secret, algorithms=[algorithm])
+
+
+def decode_token(token: str, secret: str, algorithm: str) -> dict:
+    """
+    Verify and decode a JWT, memoizing the result per token.
+
+    Tokens are immutable, so the signature only needs checking once. The expiry
+    is checked on every call since a cached token may have expired since. Callers
+    get their own copy of the payload, so mutating it can't leak into the cache.
+
+    Raises:
+        InvalidTokenError: If the token is invalid or expired
+    """
+    payload = _verify(token, secret, algorithm)
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise ExpiredSignatureError("Signature has expired")
+    return copy.deepcopy(payload)
+
+
+def _credentials_exception() -> HTTPException:
+    # Only built when a request is actually rejected. A shared instance would
+    # carry its __traceback__ and __context__ over from one request to the next.
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 class AuthManager:
     def __init__(self, jwt_secret, jwt_algorithm):
         self.jwt_secret = jwt_secret
@@ -90,7 +127,9 @@ class AuthManager:
                 db.flush()  # Get the ID
 
             # Update last_used_at
-            identification_token.last_used_at = datetime.utcnow()
+            identification_token.last_used_at = datetime.now(timezone.utc).replace(
+                tzinfo=None
+            )
 
             # Set identification header in response
             response.headers[IDENTIFICATION_HEADER] = str(identification_token.token)
@@ -103,9 +142,9 @@ class AuthManager:
     ):
         to_encode = data.copy()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = datetime.now(timezone.utc) + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=60 * 24 * 7)
+            expire = datetime.now(timezone.utc) + timedelta(minutes=60 * 24 * 7)
         to_encode.update({"exp": expire})
         encoded_jwt = jwt.encode(
             to_encode, self.jwt_secret, algorithm=self.jwt_algorithm
@@ -113,106 +152,64 @@ class AuthManager:
         return encoded_jwt
 
     def get_current_user_uuid(self, token: str = Depends(oauth2_scheme)) -> str:
-        credentials_exception = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
         try:
-            payload = jwt.decode(
-                token,
-                self.jwt_secret,
-                algorithms=[self.jwt_algorithm],
-            )
-            user_uuid: str = payload.get("sub")
-            if user_uuid is None:
-                raise credentials_exception
-        except JWTError:
-            raise credentials_exception
+            payload = decode_token(token, self.jwt_secret, self.jwt_algorithm)
+        except InvalidTokenError:
+            raise _credentials_exception()
+        user_uuid: str = payload.get("sub")
+        if user_uuid is None:
+            raise _credentials_exception()
         return user_uuid
 
     def require_any_scopes(self, scopes):
+        # scopes are fixed per route, so build the set once rather than per request
+        required_scopes = frozenset(scopes)
+
         def wrapper(token: str = Depends(oauth2_scheme)):
-            credentials_exception = HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
             try:
-                payload = jwt.decode(
-                    token,
-                    self.jwt_secret,
-                    algorithms=[self.jwt_algorithm],
-                )
-                current_scopes: str = payload.get("scopes")
-                if current_scopes is None:
-                    raise credentials_exception
-
-                if set(scopes).isdisjoint(set(current_scopes)):
-                    raise credentials_exception
+                payload = decode_token(token, self.jwt_secret, self.jwt_algorithm)
+            except InvalidTokenError:
+                raise _credentials_exception()
+            current_scopes: List[str] = payload.get("scopes")
+            if current_scopes is None:
+                raise _credentials_exception()
 
-            except JWTError:
-                raise credentials_exception
+            if required_scopes.isdisjoint(current_scopes):
+                raise _credentials_exception()
 
         return wrapper
 
     def require_all_scopes(self, scopes):
+        # scopes are fixed per route, so build the set once rather than per request
+        required_scopes = frozenset(scopes)
+
         def wrapper(token: str = Depends(oauth2_scheme)):
-            credentials_exception = HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
             try:
-                payload = jwt.decode(
-                    token,
-                    self.jwt_secret,
-                    algorithms=[self.jwt_algorithm],
-                )
-                current_scopes: str = payload.get("scopes")
-
-                if current_scopes is None:
-                    raise credentials_exception
+                payload = decode_token(token, self.jwt_secret, self.jwt_algorithm)
+            except InvalidTokenError:
+                raise _credentials_exception()
+            current_scopes: List[str] = payload.get("scopes")
+            if current_scopes is None:
+                raise _credentials_exception()
 
-                if not set(scopes).issubset(set(current_scopes)):
-                    raise credentials_exception
-
-            except JWTError:
-                raise credentials_exception
+            if not required_scopes.issubset(current_scopes):
+                raise _credentials_exception()
 
         return wrapper
 
     def current_scopes(self, token: str = Depends(oauth2_scheme)) -> List[str]:
-        credentials_exception = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
         try:
-            payload = jwt.decode(
-                token,
-                self.jwt_secret,
-                algorithms=[self.jwt_algorithm],
-            )
-            return payload.get("scopes")
-        except JWTError:
-            raise credentials_exception
+            payload = decode_token(token, self.jwt_secret, self.jwt_algorithm)
+        except InvalidTokenError:
+            raise _credentials_exception()
+        return payload.get("scopes")
 
     def is_authenticated(self, token: str = Depends(oauth2_scheme)):
-        credentials_exception = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
         try:
-            payload = jwt.decode(
-                token,
-                self.jwt_secret,
-                algorithms=[self.jwt_algorithm],
-            )
+            payload = decode_token(token, self.jwt_secret, self.jwt_algorithm)
             return payload.get("sub")
         except Exception:
-            raise credentials_exception
+            raise _credentials_exception()
 
     def maybe_authenticated(self, token: str = Depends(optional_oauth2_scheme)):
         if not token:
@@ -228,9 +225,10 @@ class AuthManager:
     ):
         to_encode = data.copy()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = datetime.now(timezone.utc) + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=60 * 24 * 7)  # Default to 7 days
+            # Default to 7 days
+            expire = datetime.now(timezone.utc) + timedelta(minutes=60 * 24 * 7)
 
         # Add jti (JWT ID) claim for tracking revoked tokens
         token_id = str(uuid.uuid4())
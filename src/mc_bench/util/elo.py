@@ -10,6 +10,9 @@ from enum import Enum
 from typing import Dict, Tuple
 
 
+_HALF_LN10_OVER_400 = math.log(10) / 800.0
+
+
 class Outcome(Enum):
     """Possible outcomes of a comparison."""
 
@@ -29,7 +32,9 @@ def expected_score(rating_a: float, rating_b: float) -> float:
     Returns:
         Expected probability of player A winning against player B
     """
-    return 1.0 / (1.0 + math.pow(10, (rating_b - rating_a) / 400.0))
+    # 1 / (1 + 10^((b - a) / 400)) written as a tanh, which cannot overflow for large
+    # rating gaps and makes expected_score(a, b) + expected_score(b, a) exactly 1
+    return 0.5 + 0.5 * math.tanh((rating_a - rating_b) * _HALF_LN10_OVER_400)
 
 
 def calculate_new_rating(
@@ -118,7 +123,8 @@ def calculate_pairwise_elo_updates(
     """
     # Calculate expected scores
     expected_a = expected_score(rating_a, rating_b)
-    expected_b = expected_score(rating_b, rating_a)
+    # The two expected scores always sum to one
+    expected_b = 1.0 - expected_a
 
     # Determine actual outcomes
     actual_a, actual_b = determine_outcome(rank_a, rank_b)
@@ -149,37 +155,32 @@ def calculate_multiway_elo_updates(
     Returns:
         Dictionary mapping entity IDs to their new ELO ratings
     """
-    # Track updates for each entity
-    updates = {entity_id: {"sum": 0.0, "count": 0} for entity_id in ratings}
+    ids = list(ratings)
+    if len(ids) < 2:
+        # Keep original ratings if there is nothing to compare against
+        return {entity_id: ratings[entity_id] for entity_id in ids}
+
+    # Look each entity up once rather than once per pair
+    entity_ratings = [ratings[entity_id] for entity_id in ids]
+    entity_ranks = [ranks[entity_id] for entity_id in ids]
+    sums = [0.0] * len(ids)
 
     # For each pair of entities
-    ids = list(ratings.keys())
-    for i, id_a in enumerate(ids):
-        for id_b in ids[i + 1 :]:
-            # Get ratings and ranks
-            rating_a = ratings[id_a]
-            rating_b = ratings[id_b]
-            rank_a = ranks[id_a]
-            rank_b = ranks[id_b]
-
-            # Calculate pairwise updates
-            pairwise_updates = calculate_pairwise_elo_updates(
-                id_a, id_b, rating_a, rating_b, rank_a, rank_b, k_factor, min_score
+    for i in range(len(ids)):
+        rating_a = entity_ratings[i]
+        rank_a = entity_ranks[i]
+        for j in range(i + 1, len(ids)):
+            rating_b = entity_ratings[j]
+
+            # The two expected scores always sum to one
+            expected_a = expected_score(rating_a, rating_b)
+            actual_a, actual_b = determine_outcome(rank_a, entity_ranks[j])
+
+            sums[i] += update_elo(rating_a, expected_a, actual_a, k_factor, min_score)
+            sums[j] += update_elo(
+                rating_b, 1.0 - expected_a, actual_b, k_factor, min_score
             )
 
-            # Accumulate updates
-            for entity_id, new_rating in pairwise_updates.items():
-                updates[entity_id]["sum"] += new_rating
-                updates[entity_id]["count"] += 1
-
-    # Average the updates
-    result = {}
-    for entity_id, update_data in updates.items():
-        if update_data["count"] > 0:
-            result[entity_id] = update_data["sum"] / update_data["count"]
-        else:
-            result[entity_id] = ratings[
-                entity_id
-            ]  # Keep original rating if no comparisons
-
-    return result
+    # Every entity takes part in exactly one comparison with each of the others
+    count = len(ids) - 1
+    return {entity_id: total / count for entity_id, total in zip(ids, sums)}
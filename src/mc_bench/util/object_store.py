@@ -26,6 +26,8 @@ import minio
 
 
 class Prototype:
+    __slots__ = ("kind", "_pattern", "registry", "parent", "children")
+
     def __init__(self, kind=None, pattern="", parent=None, children=None):
         self.kind = kind
         self._pattern = pattern
@@ -73,6 +75,19 @@ class Prototype:
     def materialize(self, **kwargs):
         return PrototypeMaterialization(self, **kwargs)
 
+    def flatten(self):
+        """
+        Map the kind of this prototype and each of its descendants to its full pattern.
+        """
+        patterns = {}
+        if self.kind is not None:
+            patterns[self.kind] = self.pattern
+
+        for child in self.children:
+            patterns.update(child.flatten())
+
+        return patterns
+
     def __repr__(self):
         return f"Prototype({self.kind!r}, pattern={self.pattern!r}, children={self.children!r})"
 
@@ -102,6 +117,8 @@ class Prototype:
 
 
 class PrototypeMaterialization:
+    __slots__ = ("prototype", "kwargs")
+
     def __init__(self, prototype, **kwargs):
         self.prototype = prototype
         self.kwargs = kwargs
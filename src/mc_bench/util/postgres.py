@@ -27,6 +27,11 @@ def get_engine(prefix="POSTGRES_", **kwargs):
 
     kwargs.setdefault("pool_pre_ping", True)
 
+    if url.drivername == "postgresql+psycopg2":
+        # Send executemany UPDATEs/DELETEs (e.g. an ORM flush of many dirty rows) as
+        # pages of statements via execute_batch rather than one round trip per row
+        kwargs.setdefault("executemany_mode", "values_plus_batch")
+
     kwargs.setdefault("connect_args", {})
     kwargs["connect_args"]["sslmode"] = kwargs["connect_args"].pop(
         "sslmode", os.environ.get(f"{prefix}SSLMODE", "require")
@@ -0,0 +1,76 @@
+"""
+Tests for the memoized JWT decoding in the auth manager.
+"""
+
+import time
+
+import jwt
+import pytest
+
+from mc_bench.server.auth import AuthManager, _verify, decode_token
+
+SECRET = "secret"
+ALGORITHM = "HS256"
+
+
+def make_token(exp, secret=SECRET, **claims):
+    return jwt.encode(
+        {"sub": "user", "exp": exp, **claims}, secret, algorithm=ALGORITHM
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _verify.cache_clear()
+    yield
+    _verify.cache_clear()
+
+
+def test_decode_token_caches_valid_tokens():
+    token = make_token(int(time.time()) + 60)
+
+    assert decode_token(token, SECRET, ALGORITHM)["sub"] == "user"
+    assert decode_token(token, SECRET, ALGORITHM)["sub"] == "user"
+
+    info = _verify.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_decode_token_rejects_cached_token_once_expired(monkeypatch):
+    now = time.time()
+    token = make_token(int(now) + 60)
+    decode_token(token, SECRET, ALGORITHM)
+
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_token(token, SECRET, ALGORITHM)
+    assert _verify.cache_info().hits == 1
+
+
+def test_decode_token_does_not_cache_invalid_tokens():
+    token = make_token(int(time.time()) + 60, secret="other-secret")
+
+    for _ in range(2):
+        with pytest.raises(jwt.InvalidTokenError):
+            decode_token(token, SECRET, ALGORITHM)
+
+    info = _verify.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+
+
+def test_decode_token_misses_cache_for_a_different_secret():
+    token = make_token(int(time.time()) + 60)
+    decode_token(token, SECRET, ALGORITHM)
+
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_token(token, "rotated-secret", ALGORITHM)
+    assert _verify.cache_info().hits == 0
+
+
+def test_current_scopes_mutation_does_not_leak_into_cache():
+    am = AuthManager(SECRET, ALGORITHM)
+    token = make_token(int(time.time()) + 60, scopes=["voting:vote"])
+
+    am.current_scopes(token).append("voting:admin")
+
+    assert am.current_scopes(token) == ["voting:vote"]
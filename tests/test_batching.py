@@ -0,0 +1,151 @@
+"""
+Tests for batching state change events into UPDATE statements.
+"""
+
+import re
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import TIMESTAMP, BigInteger, Column, MetaData, Table
+from sqlalchemy.dialects import postgresql
+
+import mc_bench.util.postgres as postgres
+from mc_bench.constants import RUN_STATE
+from mc_bench.events.batching import StateChangeBatcher, batch_update_state
+from mc_bench.events.types import RunStateChanged
+
+STATE_IDS = {state: idx for idx, state in enumerate(RUN_STATE, start=1)}
+
+run = Table(
+    "run",
+    MetaData(),
+    Column("id", BigInteger, primary_key=True),
+    Column("state_id", BigInteger),
+    Column("last_modified", TIMESTAMP),
+)
+
+
+class FakeSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+
+def compile_sql(statement):
+    return statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+
+
+def updated_pairs(statement):
+    """The (id, state_id) pairs carried by a batch_update_state statement"""
+    values = re.search(r"VALUES (.*?) AS new_state", str(compile_sql(statement)))
+    return sorted(
+        (int(row_id), int(state_id))
+        for row_id, state_id in re.findall(r"\((\d+), (\d+)\)", values.group(1))
+    )
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Every session the batcher opens, in order"""
+    opened = []
+
+    @contextmanager
+    def managed_session():
+        session = FakeSession()
+        opened.append(session)
+        yield session
+
+    monkeypatch.setattr(postgres, "managed_session", managed_session)
+    return opened
+
+
+@pytest.fixture
+def batcher():
+    batcher = StateChangeBatcher(flush_interval=60)
+    batcher.register(
+        RunStateChanged,
+        run,
+        "run_id",
+        lambda db, state: STATE_IDS[state],
+    )
+    return batcher
+
+
+@pytest.mark.parametrize("touch_last_modified", [False, True])
+def test_batch_update_state_sql(touch_last_modified):
+    db = FakeSession()
+    batch_update_state(db, run, [(1, 2), (3, 4)], touch_last_modified)
+
+    (statement,) = db.statements
+    sql = " ".join(str(compile_sql(statement)).split())
+
+    assert sql.startswith("UPDATE run SET state_id=new_state.state_id")
+    assert "FROM (VALUES (1, 2), (3, 4)) AS new_state (id, state_id)" in sql
+    assert sql.endswith("WHERE run.id = new_state.id")
+    assert ("last_modified=now()" in sql) is touch_last_modified
+
+
+def test_batch_update_state_skips_empty_batches():
+    db = FakeSession()
+    batch_update_state(db, run, [])
+    assert db.statements == []
+
+
+def test_flush_keeps_latest_state_per_row(sessions, batcher):
+    batcher.handle(RunStateChanged(run_id=1, new_state=RUN_STATE.CREATED))
+    batcher.handle(RunStateChanged(run_id=2, new_state=RUN_STATE.CREATED))
+    batcher.handle(RunStateChanged(run_id=1, new_state=RUN_STATE.IN_PROGRESS))
+    batcher.handle(RunStateChanged(run_id=1, new_state=RUN_STATE.COMPLETED))
+    batcher.flush()
+
+    (session,) = sessions
+    (statement,) = session.statements
+    assert updated_pairs(statement) == [
+        (1, STATE_IDS[RUN_STATE.COMPLETED]),
+        (2, STATE_IDS[RUN_STATE.CREATED]),
+    ]
+
+
+def test_flush_without_events_opens_no_session(sessions, batcher):
+    batcher.flush()
+    assert sessions == []
+
+
+def test_failed_flush_requeues_without_overwriting_newer_state(
+    monkeypatch, sessions, batcher
+):
+    batcher.handle(RunStateChanged(run_id=1, new_state=RUN_STATE.IN_PROGRESS))
+    batcher.handle(RunStateChanged(run_id=2, new_state=RUN_STATE.IN_PROGRESS))
+
+    def failing_execute(self, statement):
+        # A newer state for run 1 arrives while the failing flush is in flight
+        batcher.handle(RunStateChanged(run_id=1, new_state=RUN_STATE.COMPLETED))
+        raise RuntimeError("database unavailable")
+
+    with monkeypatch.context() as m:
+        m.setattr(FakeSession, "execute", failing_execute)
+        with pytest.raises(RuntimeError):
+            batcher.flush()
+
+    batcher.flush()
+
+    (statement,) = sessions[-1].statements
+    assert updated_pairs(statement) == [
+        (1, STATE_IDS[RUN_STATE.COMPLETED]),
+        (2, STATE_IDS[RUN_STATE.IN_PROGRESS]),
+    ]
+
+
+def test_stop_flushes_buffered_events(sessions, batcher):
+    batcher.start()
+    batcher.handle(RunStateChanged(run_id=1, new_state=RUN_STATE.FAILED))
+    batcher.stop()
+
+    (session,) = sessions
+    (statement,) = session.statements
+    assert updated_pairs(statement) == [(1, STATE_IDS[RUN_STATE.FAILED])]
+    assert batcher._thread is None
@@ -2,6 +2,9 @@
 Tests for the ELO calculation utilities.
 """
 
+import math
+import random
+
 import pytest
 
 from mc_bench.util.elo import (
@@ -254,3 +257,83 @@ def test_calculate_multiway_elo_updates(
     if len(set(ranks.values())) == 1:
         for entity_id in ratings:
             assert updates[entity_id] == ratings[entity_id]
+
+
+def _reference_expected_score(rating_a, rating_b):
+    """The logistic form expected_score used before it was written as a tanh"""
+    return 1 / (1 + math.pow(10, (rating_b - rating_a) / 400))
+
+
+def _reference_multiway_elo_updates(ratings, ranks, k_factor, min_score):
+    """Average of the pairwise updates, as the multiway update was first written"""
+    sums = {entity_id: 0.0 for entity_id in ratings}
+    ids = list(ratings)
+    for i, id_a in enumerate(ids):
+        for id_b in ids[i + 1 :]:
+            pairwise_updates = calculate_pairwise_elo_updates(
+                id_a,
+                id_b,
+                ratings[id_a],
+                ratings[id_b],
+                ranks[id_a],
+                ranks[id_b],
+                k_factor,
+                min_score,
+            )
+            for entity_id, new_rating in pairwise_updates.items():
+                sums[entity_id] += new_rating
+    return {entity_id: total / (len(ids) - 1) for entity_id, total in sums.items()}
+
+
+def test_expected_score_matches_logistic_form():
+    """The tanh form agrees with 1 / (1 + 10^((b - a) / 400)) to within 1 ulp of 1."""
+    rng = random.Random(0)
+    for _ in range(10_000):
+        rating_a, rating_b = rng.uniform(0, 3000), rng.uniform(0, 3000)
+        assert expected_score(rating_a, rating_b) == pytest.approx(
+            _reference_expected_score(rating_a, rating_b), rel=0, abs=math.ulp(1.0)
+        )
+
+
+def test_expected_score_complement_is_exact():
+    """Expected scores of the two sides of a comparison sum to exactly 1."""
+    rng = random.Random(1)
+    for _ in range(10_000):
+        rating_a, rating_b = rng.uniform(0, 3000), rng.uniform(0, 3000)
+        assert (
+            expected_score(rating_a, rating_b) + expected_score(rating_b, rating_a)
+            == 1.0
+        )
+
+
+@pytest.mark.parametrize("gap", [200_000, 1e9])
+def test_expected_score_huge_rating_gap(gap):
+    """Rating gaps that overflowed 10 ** (gap / 400) saturate instead of raising."""
+    with pytest.raises(OverflowError):
+        _reference_expected_score(0, gap)
+
+    assert expected_score(gap, 0) == 1.0
+    assert expected_score(0, gap) == 0.0
+
+
+def test_calculate_multiway_elo_updates_matches_pairwise_average():
+    """Multiway updates equal the average of every pairwise update."""
+    rng = random.Random(2)
+    for _ in range(500):
+        count = rng.randint(2, 8)
+        ratings = {f"e{i}": rng.uniform(100, 2500) for i in range(count)}
+        ranks = {entity_id: rng.randint(1, count) for entity_id in ratings}
+
+        updates = calculate_multiway_elo_updates(ratings, ranks, 32, 100)
+        reference = _reference_multiway_elo_updates(ratings, ranks, 32, 100)
+
+        assert updates.keys() == reference.keys()
+        for entity_id, rating in reference.items():
+            assert updates[entity_id] == pytest.approx(rating, rel=0, abs=1e-9)
+
+
+@pytest.mark.parametrize("ratings", [{}, {"a": 1234.5}])
+def test_calculate_multiway_elo_updates_needs_two_entities(ratings):
+    """With nothing to compare against, ratings come back unchanged."""
+    ranks = {entity_id: 1 for entity_id in ratings}
+    assert calculate_multiway_elo_updates(ratings, ranks, 32, 100) == ratings
@@ -0,0 +1,28 @@
+"""
+Tests for salted email hashing.
+"""
+
+import hashlib
+
+import pytest
+
+from mc_bench.auth.emails import hash_email
+
+
+def test_hash_email_returns_raw_sha256_digest():
+    digest = hash_email("someone@example.com", "salt")
+
+    assert isinstance(digest, bytes)
+    assert len(digest) == 32
+    assert digest == hashlib.sha256(b"saltsomeone@example.com").digest()
+
+
+def test_hash_email_normalizes_address():
+    assert hash_email("  Someone@Example.COM ", "salt") == hash_email(
+        "someone@example.com", "salt"
+    )
+
+
+def test_hash_email_requires_salt():
+    with pytest.raises(ValueError):
+        hash_email("someone@example.com", "")
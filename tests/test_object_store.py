@@ -0,0 +1,47 @@
+"""
+Tests for building object store keys from the run prototypes.
+"""
+
+import pytest
+
+from mc_bench.schema.object_store.runs import KINDS, comparison_samples, path_for, runs
+
+PARTS = {"run_id": 12, "sample_id": 345, "name": "abc-123"}
+
+
+def _find_prototype(prototype, kind):
+    if prototype.kind == kind:
+        return prototype
+
+    for child in prototype.children:
+        found = _find_prototype(child, kind)
+        if found is not None:
+            return found
+
+    return None
+
+
+ALL_KINDS = [
+    value
+    for key, value in vars(KINDS).items()
+    if not key.startswith("_") and isinstance(value, str)
+]
+
+
+@pytest.mark.parametrize("kind", ALL_KINDS)
+def test_path_for_matches_materialized_path(kind):
+    prototype = _find_prototype(runs, kind) or _find_prototype(comparison_samples, kind)
+
+    if prototype is None:
+        # Artifact kinds that are never written to the object store have no path
+        with pytest.raises(KeyError):
+            path_for(kind, **PARTS)
+    else:
+        assert path_for(kind, **PARTS) == prototype.materialize(**PARTS).get_path()
+
+
+def test_path_for_artifact():
+    assert (
+        path_for(KINDS.BUILD_SCHEMATIC, **PARTS)
+        == "run/12/sample/345/artifacts/abc-123-build.schem"
+    )